@@ -2,6 +2,31 @@ from .projection_matrices import FrustumBounds
 from .projection_matrices import FrustumFovBounds
 from .projection_matrices import NDCBounds
 from .projection_matrices import perspective, perspective_fov, orthographic
+from .bounds_arrays import FrustumBoundsArray, FrustumFovBoundsArray, NDCBoundsArray
+from .domain_matrices import to_domain_matrix
+from .domain_matrices import perspective_domain, perspective_fov_domain, orthographic_domain
+from .conventions import Convention
+from .conventions import CONVENTIONS
+from .conventions import CONVENTION_TABLE, conventions_from_table
+from .numeric import perspective_array, perspective_fov_array, orthographic_array
+from .numeric import apply_convention_array
+from .coalescing import CoalescingEvaluator
+from .derivation import ProjectionConstraints
+from .derivation import STANDARD, REVERSED_Z, INFINITE_FAR, REVERSED_Z_INFINITE_FAR
+from .derivation import derive_projection, instantiate_projection
+from .composition import projection_view, model_view_projection
+from .clipping import clip_planes, clip_polygons, clip_triangles
+from .packing import matrix_layout, packed_size, packed_view, pack_matrices
+from .state import ProjectionState
+from .oblique import oblique_projection, oblique_projection_array
+from .rays import pixel_rays, viewport_rays, viewport_ray_tiles
+from .depth import linearize_depth, convert_depth
+from .audit import audit_round_trip, format_audit
+from .verification import CaseResult
+from .verification import verify_case, verify_conventions, format_verification
+from .instrumentation import instrumented, timed
+from .instrumentation import enable_profiling, disable_profiling, reset_profile
+from .instrumentation import profile_stats, write_trace, profiling
 
 __all__ = [
     'FrustumBounds',
@@ -9,5 +34,59 @@ __all__ = [
     'NDCBounds',
     'perspective',
     'perspective_fov',
-    'orthographic'
+    'orthographic',
+    'FrustumBoundsArray',
+    'FrustumFovBoundsArray',
+    'NDCBoundsArray',
+    'to_domain_matrix',
+    'perspective_domain',
+    'perspective_fov_domain',
+    'orthographic_domain',
+    'Convention',
+    'CONVENTIONS',
+    'CONVENTION_TABLE',
+    'conventions_from_table',
+    'perspective_array',
+    'perspective_fov_array',
+    'orthographic_array',
+    'apply_convention_array',
+    'CoalescingEvaluator',
+    'ProjectionConstraints',
+    'STANDARD',
+    'REVERSED_Z',
+    'INFINITE_FAR',
+    'REVERSED_Z_INFINITE_FAR',
+    'derive_projection',
+    'instantiate_projection',
+    'projection_view',
+    'model_view_projection',
+    'clip_planes',
+    'clip_polygons',
+    'clip_triangles',
+    'matrix_layout',
+    'packed_size',
+    'packed_view',
+    'pack_matrices',
+    'ProjectionState',
+    'oblique_projection',
+    'oblique_projection_array',
+    'pixel_rays',
+    'viewport_rays',
+    'viewport_ray_tiles',
+    'linearize_depth',
+    'convert_depth',
+    'audit_round_trip',
+    'format_audit',
+    'CaseResult',
+    'verify_case',
+    'verify_conventions',
+    'format_verification',
+    'instrumented',
+    'timed',
+    'enable_profiling',
+    'disable_profiling',
+    'reset_profile',
+    'profile_stats',
+    'write_trace',
+    'profiling'
 ]
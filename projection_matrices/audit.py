@@ -0,0 +1,190 @@
+import numpy as np
+import sympy
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+from .projection_matrices import perspective_fov
+
+
+AUDIT_DTYPES = (np.float16, np.float32, np.float64)
+
+AUDIT_PRECISION = 50
+
+
+def _exact_matrices(frustum_fov_bounds: FrustumFovBounds, ndc_bounds: NDCBounds) -> tuple[np.ndarray, np.ndarray]:
+    # Evaluate the symbolic matrix and its inverse for the exact binary values of the
+    # parameters, and round the entries to the nearest float64.
+    exact_bounds = FrustumFovBounds(*(sympy.Rational(float(value)) for value in (
+        frustum_fov_bounds.aspect_ratio, frustum_fov_bounds.vfov,
+        frustum_fov_bounds.near, frustum_fov_bounds.far
+    )))
+    exact_ndc_bounds = NDCBounds(*(sympy.Rational(float(value)) for value in (
+        ndc_bounds.horizontal_min, ndc_bounds.horizontal_max,
+        ndc_bounds.vertical_min, ndc_bounds.vertical_max,
+        ndc_bounds.depth_min, ndc_bounds.depth_max
+    )))
+    matrix = perspective_fov(exact_bounds, exact_ndc_bounds)
+    inverse = matrix.inv()
+
+    return (
+        np.array(matrix.evalf(AUDIT_PRECISION).tolist(), dtype=np.float64),
+        np.array(inverse.evalf(AUDIT_PRECISION).tolist(), dtype=np.float64)
+    )
+
+
+def _audit_chunk(
+    matrices: dict,
+    half_extents: tuple[float, float],
+    z_min: float,
+    z_max: float,
+    count: int,
+    seed: np.random.SeedSequence
+) -> dict:
+    # Sample points in a depth band of the frustum, and return the relative error of
+    # the round trip of each point for each floating point type.
+    rng = np.random.default_rng(seed)
+    z = np.exp(rng.uniform(np.log(z_min), np.log(z_max), count))
+    points = np.empty((count, 4), dtype=np.float64)
+    points[:, 0] = rng.uniform(-1, 1, count) * half_extents[0] * z
+    points[:, 1] = rng.uniform(-1, 1, count) * half_extents[1] * z
+    points[:, 2] = z
+    points[:, 3] = 1
+
+    errors = {}
+    with np.errstate(all='ignore'):
+        for name, (matrix, inverse) in matrices.items():
+            dtype = matrix.dtype
+            sample = points.astype(dtype)
+            clip = sample @ matrix.T
+            ndc = clip / clip[:, 3:]
+            view = ndc @ inverse.T
+            result = (view[:, :3] / view[:, 3:]).astype(np.float64)
+            expected = sample[:, :3].astype(np.float64)
+            errors[name] = np.linalg.norm(result - expected, axis=1) / np.linalg.norm(expected, axis=1)
+
+    return errors
+
+
+def _summarize(errors: np.ndarray) -> dict:
+    finite = errors[np.isfinite(errors)]
+    if finite.size == 0:
+        percentiles = [np.nan] * 4
+    else:
+        percentiles = np.percentile(finite, [50, 90, 99, 100])
+
+    return {
+        'samples': errors.size,
+        'nonfinite': errors.size - finite.size,
+        'mean': float(np.mean(finite)) if finite.size else np.nan,
+        'median': float(percentiles[0]),
+        'p90': float(percentiles[1]),
+        'p99': float(percentiles[2]),
+        'max': float(percentiles[3]),
+    }
+
+
+def audit_round_trip(
+    frustum_fov_bounds: FrustumFovBounds,
+    ndc_bounds: NDCBounds,
+    bands: int = 8,
+    samples_per_band: int = 100000,
+    dtypes=AUDIT_DTYPES,
+    seed: int = 0,
+    chunk_size: int = 65536,
+    executor: Executor | None = None
+) -> dict:
+    """
+    Measure the floating point error of projecting and unprojecting points with a
+    perspective projection.
+
+    The frustum is split into depth bands with geometrically spaced bounds between `near`
+    and `far`. In each band, view space points are sampled with a log-uniform depth and a
+    uniform position in the cross section of the frustum. Each point is converted to each
+    floating point type, projected with the matrix of `perspective_fov`, divided by `w`,
+    and unprojected with the inverse matrix, with all arithmetic in that type.
+
+    The matrix and its inverse are evaluated exactly from the symbolic matrix for the
+    given parameters, and then rounded to each type, so the reported errors are the
+    errors of the round trip itself. Since the exact round trip is the identity, the
+    error of a point is the distance between the result and the point, relative to the
+    distance of the point from the origin.
+
+    The bands are split into chunks of at most `chunk_size` points, which are evaluated
+    in parallel in `executor`. When `executor` is `None`, a process pool with one process
+    per core is used for the duration of the call. Pass an executor to share one pool
+    between the audits of many cameras.
+
+    Parameters:
+    - frustum_fov_bounds: The bounds of the frustum. The fields must be numbers.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+      The fields must be numbers.
+    - bands: The number of depth bands.
+    - samples_per_band: The number of points sampled in each band.
+    - dtypes: The floating point types to audit.
+    - seed: The seed of the random number generator, for reproducible audits.
+    - chunk_size: The largest number of points evaluated in one task.
+    - executor: An optional executor to evaluate the chunks in.
+
+    Returns:
+    - A dictionary mapping the name of each floating point type to a list with the
+      statistics of each band, ordered from near to far. The statistics of a band are
+      its depth bounds `z_min` and `z_max`, the number of `samples`, the number of
+      `nonfinite` results, and the `mean`, `median`, `p90`, `p99`, and `max` of the
+      finite relative errors.
+    """
+    if bands <= 0 or samples_per_band <= 0 or chunk_size <= 0:
+        raise ValueError(f'Expected positive band, sample, and chunk counts, got {bands}, '
+                         f'{samples_per_band}, and {chunk_size}')
+
+    matrix, inverse = _exact_matrices(frustum_fov_bounds, ndc_bounds)
+    matrices = {
+        np.dtype(dtype).name: (matrix.astype(dtype), inverse.astype(dtype))
+        for dtype in dtypes
+    }
+    half_height = float(np.tan(float(frustum_fov_bounds.vfov) / 2))
+    half_extents = (float(frustum_fov_bounds.aspect_ratio) * half_height, half_height)
+    edges = np.geomspace(float(frustum_fov_bounds.near), float(frustum_fov_bounds.far), bands + 1)
+
+    tasks = []
+    for band in range(bands):
+        for start in range(0, samples_per_band, chunk_size):
+            tasks.append((band, min(chunk_size, samples_per_band - start)))
+    seeds = np.random.SeedSequence(seed).spawn(len(tasks))
+    arguments = [
+        (matrices, half_extents, edges[band], edges[band + 1], count, task_seed)
+        for (band, count), task_seed in zip(tasks, seeds)
+    ]
+
+    if executor is None:
+        with ProcessPoolExecutor() as pool:
+            results = list(pool.map(_audit_chunk, *zip(*arguments)))
+    else:
+        results = list(executor.map(_audit_chunk, *zip(*arguments)))
+
+    report = {}
+    for name in matrices:
+        report[name] = []
+        for band in range(bands):
+            errors = np.concatenate([
+                result[name] for (task_band, _), result in zip(tasks, results) if task_band == band
+            ])
+            report[name].append(dict(z_min=float(edges[band]), z_max=float(edges[band + 1]), **_summarize(errors)))
+
+    return report
+
+
+def format_audit(report: dict) -> str:
+    """
+    Format the result of `audit_round_trip` as a plain text table.
+    """
+    lines = [f'{"dtype":>8} {"z_min":>12} {"z_max":>12} {"nonfinite":>9} {"median":>10} {"p99":>10} {"max":>10}']
+    for name, band_stats in report.items():
+        for stats in band_stats:
+            lines.append(
+                f'{name:>8} {stats["z_min"]:>12.6g} {stats["z_max"]:>12.6g} {stats["nonfinite"]:>9} '
+                f'{stats["median"]:>10.3e} {stats["p99"]:>10.3e} {stats["max"]:>10.3e}'
+            )
+
+    return '\n'.join(lines)
@@ -0,0 +1,228 @@
+import dataclasses
+
+import numpy as np
+
+from collections.abc import Iterable, Iterator
+
+from .projection_matrices import FrustumBounds
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+
+
+def _column(index: int, doc: str) -> property:
+    def column(self) -> np.ndarray:
+        return self._data[index]
+
+    return property(column, doc=doc)
+
+
+class _BoundsArray:
+    # The base class of the array-backed collections of bounds. The fields of the
+    # records are stored as the rows of a single array of shape `(fields, count)`,
+    # so every field is a contiguous column of numbers.
+    __slots__ = ('_data',)
+
+    bounds_type = None
+
+    def __init__(self, *columns, validate: bool = True):
+        names = self.field_names()
+        if len(columns) != len(names):
+            raise ValueError(f'Expected {len(names)} columns {names}, got {len(columns)}')
+
+        columns = np.broadcast_arrays(*(np.asarray(column, dtype=np.float64) for column in columns))
+        if columns[0].ndim != 1:
+            raise ValueError(f'Expected one dimensional columns, got shape {columns[0].shape}')
+
+        self._data = np.empty((len(names), columns[0].shape[0]), dtype=np.float64)
+        for row, column in enumerate(columns):
+            self._data[row] = column
+
+        if validate:
+            self.validate()
+
+    @classmethod
+    def field_names(cls) -> tuple[str, ...]:
+        """
+        The names of the fields of the records, in the order of the rows of `data`.
+        """
+        return tuple(field.name for field in dataclasses.fields(cls.bounds_type))
+
+    @classmethod
+    def from_array(cls, data: np.ndarray, validate: bool = True):
+        """
+        Construct a collection backed by an existing array without copying it.
+
+        Parameters:
+        - data: A float64 array of shape `(fields, count)`, whose rows are the fields in
+          the order of `field_names`. Changes to the array are visible in the collection.
+        - validate: Whether to validate the records.
+        """
+        names = cls.field_names()
+        if data.dtype != np.float64 or data.ndim != 2 or data.shape[0] != len(names):
+            raise ValueError(f'Expected a float64 array of shape ({len(names)}, count), '
+                             f'got a {data.dtype} array of shape {data.shape}')
+
+        result = cls.__new__(cls)
+        result._data = data
+        if validate:
+            result.validate()
+
+        return result
+
+    @classmethod
+    def from_records(cls, records: Iterable, validate: bool = True):
+        """
+        Construct a collection from records of the bounds type with numerical fields.
+        """
+        names = cls.field_names()
+        data = np.array(
+            [[getattr(record, name) for name in names] for record in records], dtype=np.float64
+        ).reshape(-1, len(names))
+
+        return cls.from_array(np.ascontiguousarray(data.T), validate)
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        The array of shape `(fields, count)` backing the collection.
+        """
+        return self._data
+
+    def __len__(self) -> int:
+        return self._data.shape[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.bounds_type(*(float(value) for value in self._data[:, index]))
+
+        return self.from_array(self._data[:, index], validate=False)
+
+    def __iter__(self) -> Iterator:
+        for values in self._data.T.tolist():
+            yield self.bounds_type(*values)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(count={len(self)})'
+
+    def invalid(self) -> np.ndarray:
+        """
+        Return a boolean mask of the records that violate the constraints of the bounds type.
+        """
+        return np.isnan(self._data).any(axis=0)
+
+    def validate(self) -> None:
+        """
+        Check the constraints of every record.
+
+        Raises:
+        - ValueError: If a record violates the constraints of the bounds type.
+        """
+        indices = np.flatnonzero(self.invalid())
+        if indices.size != 0:
+            raise ValueError(f'Expected valid {self.bounds_type.__name__} records, '
+                             f'got {indices.size} invalid records at indices {indices[:10].tolist()}')
+
+
+class FrustumBoundsArray(_BoundsArray):
+    """
+    An array-backed collection of `FrustumBounds` records with numerical fields.
+
+    Each field is a contiguous column of float64 numbers, so the collection can be
+    passed wherever a `FrustumBounds` with array fields is expected, such as
+    `perspective_array` and `orthographic_array`. Indexing with an integer returns a
+    `FrustumBounds` record, and indexing with a slice returns a collection viewing the
+    same memory.
+
+    The records are validated against the constraints `left > 0`, `right > 0`,
+    `bottom > 0`, `top > 0`, and `far > near > 0` documented in `perspective`.
+
+    Parameters:
+    - left, right, bottom, top, near, far: The columns of the fields. They are numbers or
+      one dimensional arrays, which are broadcast against each other and copied.
+    - validate: Whether to validate the records.
+    """
+    __slots__ = ()
+
+    bounds_type = FrustumBounds
+
+    left = _column(0, 'The column of the left plane distances.')
+    right = _column(1, 'The column of the right plane distances.')
+    bottom = _column(2, 'The column of the bottom plane distances.')
+    top = _column(3, 'The column of the top plane distances.')
+    near = _column(4, 'The column of the near plane distances.')
+    far = _column(5, 'The column of the far plane distances.')
+
+    def invalid(self) -> np.ndarray:
+        l, r, b, t, n, f = self._data
+        valid = (l > 0) & (r > 0) & (b > 0) & (t > 0) & (n > 0) & (f > n)
+
+        return ~valid
+
+
+class FrustumFovBoundsArray(_BoundsArray):
+    """
+    An array-backed collection of `FrustumFovBounds` records with numerical fields.
+
+    Each field is a contiguous column of float64 numbers, so the collection can be
+    passed wherever a `FrustumFovBounds` with array fields is expected, such as
+    `perspective_fov_array` and `ProjectionState`. Indexing with an integer returns a
+    `FrustumFovBounds` record, and indexing with a slice returns a collection viewing
+    the same memory.
+
+    The records are validated against the constraints `aspect_ratio > 0`,
+    `0 < vfov < pi`, and `far > near > 0` documented in `perspective_fov`.
+
+    Parameters:
+    - aspect_ratio, vfov, near, far: The columns of the fields. They are numbers or one
+      dimensional arrays, which are broadcast against each other and copied.
+    - validate: Whether to validate the records.
+    """
+    __slots__ = ()
+
+    bounds_type = FrustumFovBounds
+
+    aspect_ratio = _column(0, 'The column of the aspect ratios.')
+    vfov = _column(1, 'The column of the vertical fields of view in radians.')
+    near = _column(2, 'The column of the near plane distances.')
+    far = _column(3, 'The column of the far plane distances.')
+
+    def invalid(self) -> np.ndarray:
+        aspect_ratio, vfov, n, f = self._data
+        valid = (aspect_ratio > 0) & (vfov > 0) & (vfov < np.pi) & (n > 0) & (f > n)
+
+        return ~valid
+
+
+class NDCBoundsArray(_BoundsArray):
+    """
+    An array-backed collection of `NDCBounds` records with numerical fields.
+
+    Each field is a contiguous column of float64 numbers, so the collection can be
+    passed wherever an `NDCBounds` with array fields is expected, such as
+    `perspective_array`. Indexing with an integer returns an `NDCBounds` record, and
+    indexing with a slice returns a collection viewing the same memory.
+
+    The records are validated to have finite bounds and a nonzero extent along each axis.
+
+    Parameters:
+    - horizontal_min, horizontal_max, vertical_min, vertical_max, depth_min, depth_max:
+      The columns of the fields. They are numbers or one dimensional arrays, which are
+      broadcast against each other and copied.
+    - validate: Whether to validate the records.
+    """
+    __slots__ = ()
+
+    bounds_type = NDCBounds
+
+    horizontal_min = _column(0, 'The column of the minimum horizontal bounds.')
+    horizontal_max = _column(1, 'The column of the maximum horizontal bounds.')
+    vertical_min = _column(2, 'The column of the minimum vertical bounds.')
+    vertical_max = _column(3, 'The column of the maximum vertical bounds.')
+    depth_min = _column(4, 'The column of the minimum depth bounds.')
+    depth_max = _column(5, 'The column of the maximum depth bounds.')
+
+    def invalid(self) -> np.ndarray:
+        h_min, h_max, v_min, v_max, d_min, d_max = self._data
+        valid = np.isfinite(self._data).all(axis=0) & (h_min != h_max) & (v_min != v_max) & (d_min != d_max)
+
+        return ~valid
@@ -0,0 +1,231 @@
+import argparse
+import csv
+import dataclasses
+import json
+import sys
+
+import numpy as np
+
+from collections.abc import Iterator
+from typing import IO
+
+from .bounds_arrays import FrustumBoundsArray
+from .bounds_arrays import FrustumFovBoundsArray
+from .conventions import CONVENTIONS
+from .conventions import Convention
+from .numeric import PROJECTIONS
+from .numeric import apply_convention_array
+from .projection_matrices import NDCBounds
+
+INPUT_FORMATS = ('csv', 'jsonl')
+
+OUTPUT_FORMATS = ('jsonl', 'f32', 'c-header')
+
+_BOUNDS_ARRAYS = {array_type.bounds_type: array_type for array_type in (FrustumBoundsArray, FrustumFovBoundsArray)}
+
+
+def _read_rows(stream: IO[str], input_format: str, bounds_type: type) -> Iterator[dict]:
+    if input_format == 'csv':
+        yield from csv.DictReader(stream)
+    else:
+        record_number = 0
+        for line in stream:
+            if line.strip():
+                record_number += 1
+                try:
+                    row = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f'Invalid {bounds_type.__name__} record {record_number}: {e!r}') from e
+
+                yield row
+
+
+def _check_chunk(chunk: np.ndarray, bounds_type: type, first_record_number: int) -> np.ndarray:
+    # Reject the records that violate the constraints of the bounds type, since they
+    # produce matrices with infinite or NaN entries.
+    records = _BOUNDS_ARRAYS[bounds_type].from_array(chunk, validate=False)
+    invalid = records.invalid() | ~np.isfinite(chunk).all(axis=0)
+    if invalid.any():
+        index = int(np.argmax(invalid))
+        raise ValueError(f'Invalid {bounds_type.__name__} record {first_record_number + index}: '
+                         f'{records[index]} violates the constraints of {bounds_type.__name__}')
+
+    return chunk
+
+
+def _read_chunks(stream: IO[str], input_format: str, bounds_type: type, chunk_size: int) -> Iterator[np.ndarray]:
+    names = [field.name for field in dataclasses.fields(bounds_type)]
+    buffer = np.empty((len(names), chunk_size), dtype=np.float64)
+    count = 0
+    for record_number, row in enumerate(_read_rows(stream, input_format, bounds_type), start=1):
+        try:
+            for i, name in enumerate(names):
+                buffer[i, count] = float(row[name])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f'Invalid {bounds_type.__name__} record {record_number}: {e!r}') from e
+
+        count += 1
+        if count == chunk_size:
+            yield _check_chunk(buffer, bounds_type, record_number - count + 1)
+            count = 0
+
+    if count > 0:
+        yield _check_chunk(buffer[:, :count], bounds_type, record_number - count + 1)
+
+
+def _evaluate_chunks(
+    chunks: Iterator[np.ndarray],
+    projection: str,
+    ndc_bounds: NDCBounds,
+    convention: Convention | None
+) -> Iterator[np.ndarray]:
+    bounds_type, evaluate = PROJECTIONS[projection]
+    out = None
+    for columns in chunks:
+        count = columns.shape[1]
+        if out is None or out.shape[0] < count:
+            out = np.empty((count, 4, 4), dtype=np.float64)
+
+        matrices = evaluate(bounds_type(*columns), ndc_bounds, out=out[:count])
+        if convention is not None:
+            apply_convention_array(convention, matrices, out=matrices)
+
+        yield matrices
+
+
+def _write_matrices(chunks: Iterator[np.ndarray], stream: IO, output_format: str, order: str) -> int:
+    count = 0
+    if output_format == 'c-header':
+        stream.write('#pragma once\n\n')
+        stream.write(f'/* Projection matrices in {order}-major order. */\n')
+        stream.write('static const float projection_matrices[][16] = {\n')
+
+    for matrices in chunks:
+        count += matrices.shape[0]
+        if order == 'column':
+            entries = matrices.transpose(0, 2, 1)
+        else:
+            entries = matrices
+
+        if output_format == 'jsonl':
+            for matrix in entries:
+                stream.write(json.dumps(matrix.tolist()) + '\n')
+        elif output_format == 'f32':
+            stream.write(np.ascontiguousarray(entries, dtype='<f4').tobytes())
+        else:
+            for matrix in entries.astype(np.float32).reshape(-1, 16):
+                stream.write('    {' + ', '.join(f'{value!s}f' for value in matrix) + '},\n')
+
+    if output_format == 'c-header':
+        stream.write('};\n\n')
+        stream.write(f'#define PROJECTION_MATRICES_COUNT {count}\n')
+
+    return count
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='python -m projection_matrices',
+        description='Evaluate projection matrices for a stream of frustum records.'
+    )
+    parser.add_argument(
+        'projection', choices=sorted(PROJECTIONS),
+        help='The kind of projection. Records for perspective and orthographic projections have the fields of '
+             'FrustumBounds, and records for perspective_fov projections have the fields of FrustumFovBounds.'
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        '--convention', choices=sorted(CONVENTIONS),
+        help='The target graphics API convention.'
+    )
+    target.add_argument(
+        '--ndc-bounds', type=float, nargs=6,
+        metavar=('H_MIN', 'H_MAX', 'V_MIN', 'V_MAX', 'D_MIN', 'D_MAX'),
+        help='The bounds of the canonical view volume. The matrices are in the canonical orthonormal frames.'
+    )
+    parser.add_argument('--input', default='-', help='The input file, or - for stdin (default: -).')
+    parser.add_argument(
+        '--input-format', choices=INPUT_FORMATS,
+        help='The input format (default: jsonl for .jsonl and .json files and stdin, csv otherwise).'
+    )
+    parser.add_argument('--output', default='-', help='The output file, or - for stdout (default: -).')
+    parser.add_argument(
+        '--output-format', choices=OUTPUT_FORMATS, default='jsonl',
+        help='The output format. JSON output lists the rows of each matrix in row order, and the columns '
+             'in column order (default: jsonl).'
+    )
+    parser.add_argument(
+        '--order', choices=('row', 'column'), default='column',
+        help='The order of the entries of each matrix in the output (default: column).'
+    )
+    parser.add_argument(
+        '--chunk-size', type=int, default=4096,
+        help='The number of records evaluated at a time (default: 4096).'
+    )
+    args = parser.parse_args(argv)
+
+    if args.chunk_size <= 0:
+        parser.error('--chunk-size must be positive')
+
+    if args.input_format is None:
+        if args.input == '-' or args.input.endswith(('.jsonl', '.json')):
+            args.input_format = 'jsonl'
+        else:
+            args.input_format = 'csv'
+
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Evaluate projection matrices for a stream of frustum records.
+
+    The records are read from a CSV file with a header row, or from a file with one
+    JSON object per line. The fields of each record are the fields of `FrustumBounds`
+    or `FrustumFovBounds`, depending on the kind of projection, and must be finite
+    numbers satisfying the constraints documented in `perspective` or
+    `perspective_fov`. The number of the first record that is malformed or violates
+    these constraints is reported as an error. The records are evaluated in fixed size
+    chunks, so the memory usage does not depend on the number
+    of records. The matrices are written as one JSON array per line, as raw little
+    endian float32 values, or as a C header.
+
+    Parameters:
+    - argv: The command line arguments. When `None`, the arguments are read from `sys.argv`.
+
+    Returns:
+    - The exit status of the program.
+    """
+    args = _parse_args(argv)
+    if args.convention is not None:
+        convention = CONVENTIONS[args.convention]
+        ndc_bounds = convention.ndc_bounds
+    else:
+        convention = None
+        ndc_bounds = NDCBounds(*args.ndc_bounds)
+
+    bounds_type, _ = PROJECTIONS[args.projection]
+    input_stream = None
+    output_stream = None
+    try:
+        input_stream = sys.stdin if args.input == '-' else open(args.input, newline='')
+        if args.output == '-':
+            output_stream = sys.stdout.buffer if args.output_format == 'f32' else sys.stdout
+        else:
+            output_stream = open(args.output, 'wb' if args.output_format == 'f32' else 'w')
+
+        chunks = _read_chunks(input_stream, args.input_format, bounds_type, args.chunk_size)
+        matrices = _evaluate_chunks(chunks, args.projection, ndc_bounds, convention)
+        _write_matrices(matrices, output_stream, args.output_format, args.order)
+    except (ValueError, OSError) as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 1
+    finally:
+        if input_stream not in (None, sys.stdin):
+            input_stream.close()
+        if output_stream in (sys.stdout, sys.stdout.buffer):
+            output_stream.flush()
+        elif output_stream is not None:
+            output_stream.close()
+
+    return 0
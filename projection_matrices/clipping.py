@@ -0,0 +1,168 @@
+import numpy as np
+
+from .projection_matrices import NDCBounds
+
+
+# Clipping a triangle against six planes adds at most one vertex per plane.
+MAX_POLYGON_VERTICES = 9
+
+
+def clip_planes(ndc_bounds: NDCBounds, dtype=np.float64) -> np.ndarray:
+    """
+    Construct the planes bounding the canonical view volume in homogeneous clip space.
+
+    A point `[x, y, z, w]^T` in clip space lies inside the canonical view volume when
+    `h_min * w <= x <= h_max * w`, `v_min * w <= y <= v_max * w`, and
+    `d_min * w <= z <= d_max * w`. Each plane `p` is a row of the result such that
+    `dot(p, [x, y, z, w]) >= 0` on the inside of the plane. The planes are ordered as
+    left, right, bottom, top, near, far.
+
+    Parameters:
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - dtype: The floating point type of the result.
+
+    Returns:
+    - A 6x4 array of plane coefficients.
+    """
+    h_min = float(ndc_bounds.horizontal_min)
+    h_max = float(ndc_bounds.horizontal_max)
+    v_min = float(ndc_bounds.vertical_min)
+    v_max = float(ndc_bounds.vertical_max)
+    d_min = float(ndc_bounds.depth_min)
+    d_max = float(ndc_bounds.depth_max)
+
+    return np.array([
+        [1,   0,  0, -h_min],
+        [-1,  0,  0,  h_max],
+        [0,   1,  0, -v_min],
+        [0,  -1,  0,  v_max],
+        [0,   0,  1, -d_min],
+        [0,   0, -1,  d_max]
+    ], dtype=dtype)
+
+
+def _clip_polygons(polygons: np.ndarray, counts: np.ndarray, plane: np.ndarray) -> None:
+    # One Sutherland-Hodgman pass over a batch of polygons stored in fixed size slots,
+    # updating `polygons` and `counts` in place. Only the polygons with a vertex outside
+    # the plane are touched. Every edge from a vertex to its successor emits the vertex
+    # when it is inside, and the intersection with the plane when the edge crosses it.
+    capacity = polygons.shape[1]
+    slots = np.arange(capacity)
+    valid = slots < counts[:, None]
+    distances = polygons @ plane
+    active = np.flatnonzero(((distances < 0) & valid).any(axis=1))
+    if active.size == 0:
+        return
+
+    active_polygons = polygons[active]
+    active_counts = counts[active]
+    distances = distances[active]
+    valid = valid[active]
+    successors = np.where(slots + 1 < active_counts[:, None], slots + 1, 0)
+    successor_distances = np.take_along_axis(distances, successors, axis=1)
+    inside = (distances >= 0) & valid
+    crossing = (inside != (successor_distances >= 0)) & valid
+    emitted = inside.astype(np.intp) + crossing
+    positions = np.cumsum(emitted, axis=1) - emitted
+    base = np.arange(active.size)[:, None] * capacity
+
+    result = np.zeros_like(active_polygons)
+    result_vertices = result.reshape(-1, 4)
+    result_vertices[(base + positions)[inside]] = active_polygons[inside]
+
+    start = active_polygons[crossing]
+    end = active_polygons.reshape(-1, 4)[(base + successors)[crossing]]
+    start_distances = distances[crossing]
+    t = start_distances / (start_distances - successor_distances[crossing])
+    result_vertices[(base + positions + inside)[crossing]] = start + t[:, None] * (end - start)
+
+    polygons[active] = result
+    counts[active] = emitted.sum(axis=1)
+
+
+def clip_polygons(triangles: np.ndarray, ndc_bounds: NDCBounds) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Clip a batch of triangles in homogeneous clip space against the canonical view volume.
+
+    The triangles are given in the canonical clip space of a projection constructed by
+    this library with the same `ndc_bounds`, so the depth range of the clip volume
+    follows `ndc_bounds.depth_min` and `ndc_bounds.depth_max`. Triangles that lie
+    entirely inside the view volume are passed through, triangles that lie entirely
+    outside one of its planes are discarded, and the remaining triangles are clipped
+    against all six planes together, one plane at a time.
+
+    The result is a packed buffer of polygon vertices and an array of offsets. The
+    vertices of the polygon clipped from the i-th triangle are
+    `vertices[offsets[i]:offsets[i + 1]]` in counterclockwise order if the triangle was
+    counterclockwise. A triangle that was clipped away entirely has no vertices.
+
+    Parameters:
+    - triangles: An array of triangles of shape `(N, 3, 4)` in homogeneous clip space.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+
+    Returns:
+    - An array of shape `(M, 4)` of polygon vertices, and an array of shape `(N + 1,)` of
+      offsets into it.
+    """
+    triangles = np.asarray(triangles)
+    if triangles.ndim != 3 or triangles.shape[1:] != (3, 4):
+        raise ValueError(f'Expected an array of triangles of shape (N, 3, 4), got {triangles.shape}')
+
+    dtype = np.result_type(triangles.dtype, np.float32)
+    planes = clip_planes(ndc_bounds, dtype)
+    inside = (triangles @ planes.T) >= 0
+    accepted = inside.all(axis=(1, 2))
+    rejected = (~inside).all(axis=1).any(axis=1)
+    partial = np.flatnonzero(~(accepted | rejected))
+
+    polygons = np.zeros((partial.size, MAX_POLYGON_VERTICES, 4), dtype=dtype)
+    polygons[:, :3] = triangles[partial]
+    polygon_counts = np.full(partial.size, 3, dtype=np.intp)
+    for plane in planes:
+        _clip_polygons(polygons, polygon_counts, plane)
+
+    polygon_counts[polygon_counts < 3] = 0
+
+    counts = np.where(accepted, 3, 0)
+    counts[partial] = polygon_counts
+    offsets = np.zeros(triangles.shape[0] + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+
+    vertices = np.empty((offsets[-1], 4), dtype=dtype)
+    indices = np.flatnonzero(accepted)
+    vertices[offsets[indices][:, None] + np.arange(3)] = triangles[indices]
+
+    rows, columns = np.nonzero(np.arange(MAX_POLYGON_VERTICES) < polygon_counts[:, None])
+    vertices[offsets[partial][rows] + columns] = polygons[rows, columns]
+
+    return vertices, offsets
+
+
+def clip_triangles(triangles: np.ndarray, ndc_bounds: NDCBounds) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Clip a batch of triangles in homogeneous clip space against the canonical view volume,
+    and triangulate the clipped polygons.
+
+    This clips the triangles with `clip_polygons`, and splits each clipped polygon into a
+    fan of triangles around its first vertex. The triangles clipped from the i-th input
+    triangle are `result[offsets[i]:offsets[i + 1]]`.
+
+    Parameters:
+    - triangles: An array of triangles of shape `(N, 3, 4)` in homogeneous clip space.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+
+    Returns:
+    - An array of shape `(K, 3, 4)` of triangles, and an array of shape `(N + 1,)` of
+      offsets into it.
+    """
+    vertices, vertex_offsets = clip_polygons(triangles, ndc_bounds)
+    triangle_counts = np.maximum(np.diff(vertex_offsets) - 2, 0)
+    offsets = np.zeros_like(vertex_offsets)
+    np.cumsum(triangle_counts, out=offsets[1:])
+
+    polygons = np.repeat(np.arange(triangle_counts.size), triangle_counts)
+    fan = np.arange(offsets[-1]) - offsets[polygons] + 1
+    first = vertex_offsets[polygons]
+    indices = np.stack([first, first + fan, first + fan + 1], axis=1)
+
+    return vertices[indices], offsets
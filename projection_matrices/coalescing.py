@@ -0,0 +1,194 @@
+import asyncio
+import dataclasses
+
+import numpy as np
+
+from concurrent.futures import Executor
+
+from .numeric import PROJECTIONS
+from .projection_matrices import FrustumBounds
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+
+
+class CoalescingEvaluator:
+    """
+    An asyncio evaluator that coalesces concurrent projection requests into micro-batches.
+
+    Each request for a projection matrix is queued together with a future. The queued
+    requests are evaluated together in one vectorized call when either the oldest
+    queued request has waited for `max_latency` seconds, or `max_batch_size` requests
+    have been queued. Requests with different projection kinds or different
+    `NDCBounds` are evaluated in separate calls within the same micro-batch. The fields
+    of the bounds are converted to floats when a request is made, so a request with
+    fields that are not numbers raises a `ValueError` without being queued, and does not
+    affect the other requests of its micro-batch.
+
+    When an `executor` is given, the vectorized calls run in the executor, so the event
+    loop is not blocked by large micro-batches.
+
+    Parameters:
+    - max_latency: The maximum time in seconds a request waits before its micro-batch
+      is evaluated.
+    - max_batch_size: The number of queued requests that triggers an immediate evaluation.
+    - executor: An optional executor to evaluate the micro-batches in.
+    """
+    def __init__(self, max_latency: float = 0.001, max_batch_size: int = 1024, executor: Executor | None = None):
+        if max_latency < 0:
+            raise ValueError(f'Expected a non-negative latency, got {max_latency}')
+        if max_batch_size <= 0:
+            raise ValueError(f'Expected a positive batch size, got {max_batch_size}')
+
+        self.max_latency = max_latency
+        self.max_batch_size = max_batch_size
+        self.executor = executor
+        self._pending = {}
+        self._queue_depth = 0
+        self._timer = None
+        self._tasks = set()
+        self._requests = 0
+        self._batches = 0
+        self._evaluations = 0
+        self._last_batch_size = 0
+        self._max_batch_size_seen = 0
+
+    async def perspective(self, frustum_bounds: FrustumBounds, ndc_bounds: NDCBounds) -> np.ndarray:
+        """
+        Evaluate a perspective projection in the canonical orthonormal frames.
+
+        See `perspective` for a description of the parameters.
+
+        Returns:
+        - A 4x4 array containing the perspective projection matrix.
+        """
+        return await self._submit('perspective', frustum_bounds, ndc_bounds)
+
+    async def perspective_fov(self, frustum_fov_bounds: FrustumFovBounds, ndc_bounds: NDCBounds) -> np.ndarray:
+        """
+        Evaluate a perspective projection in the canonical orthonormal frames.
+
+        See `perspective_fov` for a description of the parameters.
+
+        Returns:
+        - A 4x4 array containing the perspective projection matrix.
+        """
+        return await self._submit('perspective_fov', frustum_fov_bounds, ndc_bounds)
+
+    async def orthographic(self, frustum_bounds: FrustumBounds, ndc_bounds: NDCBounds) -> np.ndarray:
+        """
+        Evaluate an orthographic projection in the canonical orthonormal frames.
+
+        See `orthographic` for a description of the parameters.
+
+        Returns:
+        - A 4x4 array containing the orthographic projection matrix.
+        """
+        return await self._submit('orthographic', frustum_bounds, ndc_bounds)
+
+    def metrics(self) -> dict:
+        """
+        Return the queue depth and batch size metrics of the evaluator.
+
+        The metrics are the following.
+
+        * `queue_depth` is the number of requests waiting for their micro-batch.
+        * `requests` is the number of requests evaluated so far.
+        * `batches` is the number of micro-batches evaluated so far.
+        * `evaluations` is the number of vectorized calls made so far.
+        * `last_batch_size` is the number of requests in the last micro-batch.
+        * `max_batch_size` is the largest number of requests in a micro-batch.
+        * `mean_batch_size` is the mean number of requests in a micro-batch.
+        """
+        return {
+            'queue_depth': self._queue_depth,
+            'requests': self._requests,
+            'batches': self._batches,
+            'evaluations': self._evaluations,
+            'last_batch_size': self._last_batch_size,
+            'max_batch_size': self._max_batch_size_seen,
+            'mean_batch_size': self._requests / self._batches if self._batches > 0 else 0.0,
+        }
+
+    async def flush(self) -> None:
+        """
+        Evaluate the queued requests immediately, and wait for all micro-batches in
+        flight to complete.
+        """
+        self._schedule_flush()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def __aenter__(self) -> 'CoalescingEvaluator':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.flush()
+
+    def _submit(self, kind: str, bounds, ndc_bounds: NDCBounds) -> asyncio.Future:
+        # Convert the parameters before queueing the request, so a malformed request fails
+        # on its own instead of failing every request of its micro-batch.
+        try:
+            parameters = tuple(float(value) for value in dataclasses.astuple(bounds))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f'Expected numerical {type(bounds).__name__} fields, got {bounds}') from e
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (kind, ndc_bounds)
+        self._pending.setdefault(key, []).append((parameters, future))
+        self._queue_depth += 1
+
+        if self._queue_depth >= self.max_batch_size:
+            self._schedule_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._schedule_flush)
+
+        return future
+
+    def _schedule_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        pending = self._pending
+        batch_size = self._queue_depth
+        self._pending = {}
+        self._queue_depth = 0
+        self._requests += batch_size
+        self._batches += 1
+        self._last_batch_size = batch_size
+        self._max_batch_size_seen = max(self._max_batch_size_seen, batch_size)
+
+        task = asyncio.ensure_future(self._evaluate_batch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _evaluate_batch(self, pending: dict) -> None:
+        loop = asyncio.get_running_loop()
+        for (kind, ndc_bounds), requests in pending.items():
+            futures = [future for _, future in requests]
+            self._evaluations += 1
+            try:
+                columns = np.array([parameters for parameters, _ in requests], dtype=np.float64).T
+                if self.executor is None:
+                    matrices = _evaluate(kind, columns, ndc_bounds)
+                else:
+                    matrices = await loop.run_in_executor(self.executor, _evaluate, kind, columns, ndc_bounds)
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for future, matrix in zip(futures, matrices):
+                if not future.done():
+                    future.set_result(matrix)
+
+
+def _evaluate(kind: str, columns: np.ndarray, ndc_bounds: NDCBounds) -> np.ndarray:
+    bounds_type, evaluate = PROJECTIONS[kind]
+
+    return evaluate(bounds_type(*columns), ndc_bounds)
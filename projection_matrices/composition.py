@@ -0,0 +1,91 @@
+import numpy as np
+import sympy
+
+
+LAYOUTS = ('row_major', 'column_major')
+
+
+def _as_array(matrix: sympy.Matrix | np.ndarray) -> np.ndarray:
+    if isinstance(matrix, sympy.MatrixBase):
+        return np.array(matrix.evalf().tolist(), dtype=np.float64)
+    else:
+        return np.asarray(matrix, dtype=np.float64)
+
+
+def projection_view(projection: sympy.Matrix | np.ndarray, view: sympy.Matrix | np.ndarray) -> np.ndarray:
+    """
+    Compute the product of a projection matrix and a view matrix using only the nonzero
+    entries of the projection.
+
+    Each row of a projection matrix constructed by this library has at most two nonzero
+    entries, so each row of the product is a combination of at most two rows of the
+    view matrix.
+
+    Parameters:
+    - projection: A 4x4 projection matrix with numerical entries.
+    - view: A 4x4 view matrix.
+
+    Returns:
+    - The 4x4 product of the projection and the view matrix.
+    """
+    projection = _as_array(projection)
+    view = _as_array(view)
+    result = np.zeros((4, 4), dtype=np.float64)
+    for row, column in zip(*np.nonzero(projection)):
+        result[row] += projection[row, column] * view[column]
+
+    return result
+
+
+def model_view_projection(
+    projection: sympy.Matrix | np.ndarray,
+    view: sympy.Matrix | np.ndarray,
+    models: np.ndarray,
+    out: np.ndarray | None = None,
+    layout: str = 'row_major'
+) -> np.ndarray:
+    """
+    Compute the model-view-projection matrices for a batch of model matrices.
+
+    The projection and the view matrix are folded into a single matrix once with
+    `projection_view`, so each model matrix costs a single 4x4 matrix product, and no
+    intermediate batch of view-model products is formed. The products are written
+    directly into `out` when it is given, so a caller can reuse the same buffer every
+    frame.
+
+    With the `'row_major'` layout, `out[i, r, c]` is the entry in row `r` and column `c`
+    of the i-th matrix. With the `'column_major'` layout, `out[i, c, r]` is that entry,
+    so each matrix is stored column by column. A `float32` array in the `'column_major'`
+    layout matches the std140 and std430 layouts of a GLSL `mat4`.
+
+    Parameters:
+    - projection: A 4x4 projection matrix with numerical entries.
+    - view: A 4x4 view matrix.
+    - models: An array of model matrices of shape `(N, 4, 4)`.
+    - out: An optional array of shape `(N, 4, 4)` to write the matrices into.
+    - layout: The layout of each matrix in the result, one of `'row_major'` or
+      `'column_major'`.
+
+    Returns:
+    - An array of shape `(N, 4, 4)` containing the model-view-projection matrices.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f'Expected a layout in {LAYOUTS}, got {layout!r}')
+
+    models = np.asarray(models)
+    if models.ndim != 3 or models.shape[1:] != (4, 4):
+        raise ValueError(f'Expected an array of model matrices of shape (N, 4, 4), got {models.shape}')
+
+    if out is None:
+        out = np.empty(models.shape, dtype=np.result_type(models.dtype, np.float64))
+    elif out.shape != models.shape:
+        raise ValueError(f'Expected an output array of shape {models.shape}, got {out.shape}')
+
+    if layout == 'column_major':
+        target = out.transpose(0, 2, 1)
+    else:
+        target = out
+
+    np.matmul(projection_view(projection, view), models, out=target, casting='same_kind')
+
+    return out
@@ -0,0 +1,170 @@
+import sympy
+
+from dataclasses import dataclass
+
+from .instrumentation import instrumented
+from .projection_matrices import NDCBounds
+
+
+def change_of_orientation_lh_to_rh() -> sympy.Matrix:
+    """
+    Construct the change of orientation from a left-handed orthonormal frame to a
+    right-handed orthonormal frame by reflecting the depth axis.
+    """
+    return sympy.Matrix([
+        [1, 0,  0, 0],
+        [0, 1,  0, 0],
+        [0, 0, -1, 0],
+        [0, 0,  0, 1]
+    ])
+
+
+def change_of_orientation_rh_to_lh() -> sympy.Matrix:
+    """
+    Construct the change of orientation from a right-handed orthonormal frame to a
+    left-handed orthonormal frame by reflecting the depth axis.
+    """
+    return sympy.Matrix([
+        [1, 0,  0, 0],
+        [0, 1,  0, 0],
+        [0, 0, -1, 0],
+        [0, 0,  0, 1]
+    ])
+
+
+def rotation_x(angle: sympy.Symbol) -> sympy.Matrix:
+    """
+    Construct a rotation about the **positive x-axis** by `angle`.
+    """
+    return sympy.Matrix([
+        [1, 0,                 0,                0],
+        [0, sympy.cos(angle), -sympy.sin(angle), 0],
+        [0, sympy.sin(angle),  sympy.cos(angle), 0],
+        [0, 0,                 0,                1]
+    ])
+
+
+@dataclass(frozen=True)
+class Convention:
+    """
+    A data class describing the view space and clip space conventions of a graphics API.
+
+    A convention is specified by the following parameters.
+
+    * `api` is the name of the graphics API.
+    * `handedness` is the orientation of the view space orthonormal frame, one of
+      `'left'` or `'right'`.
+    * `y_direction` is the direction of the **positive y-axis** of the clip space
+      orthonormal frame, one of `'up'` or `'down'`.
+    * `ndc_bounds` are the bounds of the canonical view volume of the graphics API.
+
+    A projection in the convention is obtained from a projection in the canonical
+    orthonormal frames by composing it with the change of coordinates from the view
+    space of the convention to the canonical view space, followed by the change of
+    coordinates from the canonical clip space to the clip space of the convention.
+    """
+    api: str
+    handedness: str
+    y_direction: str
+    ndc_bounds: NDCBounds
+
+    def coordinate_transform(self) -> sympy.Matrix:
+        """
+        Construct the change of coordinates between the frames of the convention and
+        the canonical frames that do not depend on the orientation.
+        """
+        if self.y_direction == 'down':
+            return rotation_x(sympy.pi)
+        else:
+            return sympy.Matrix.eye(4)
+
+    def clip_transform(self) -> sympy.Matrix:
+        """
+        Construct the change of coordinates from the canonical clip space to the clip
+        space of the convention.
+        """
+        if self.y_direction == 'down':
+            x_clip = change_of_orientation_lh_to_rh()
+        else:
+            x_clip = sympy.Matrix.eye(4)
+
+        return x_clip * self.coordinate_transform().inv()
+
+    def view_transform(self) -> sympy.Matrix:
+        """
+        Construct the change of coordinates from the view space of the convention to the
+        canonical view space.
+        """
+        if self.handedness == 'right':
+            x_view = change_of_orientation_rh_to_lh()
+        else:
+            x_view = sympy.Matrix.eye(4)
+
+        return self.coordinate_transform() * x_view
+
+    @instrumented()
+    def apply(self, matrix: sympy.Matrix) -> sympy.Matrix:
+        """
+        Convert a projection matrix in the canonical orthonormal frames into a projection
+        matrix in the convention.
+
+        Parameters:
+        - matrix: A projection matrix constructed with `ndc_bounds` in the canonical
+          orthonormal frames.
+
+        Returns:
+        - A 4x4 projection matrix in the convention.
+        """
+        return self.clip_transform() * matrix * self.view_transform()
+
+
+HANDEDNESSES = ('left', 'right')
+
+Y_DIRECTIONS = ('up', 'down')
+
+# The conventions of the supported graphics APIs as rows of the form
+# `(api, handedness, y_direction, (depth_min, depth_max))`.
+CONVENTION_TABLE = (
+    ('opengl',  'left',  'up',   (-1, 1)),
+    ('opengl',  'right', 'up',   (-1, 1)),
+    ('vulkan',  'left',  'down', (0, 1)),
+    ('vulkan',  'right', 'down', (0, 1)),
+    ('directx', 'left',  'up',   (0, 1)),
+    ('directx', 'right', 'up',   (0, 1)),
+    ('metal',   'left',  'up',   (0, 1)),
+    ('metal',   'right', 'up',   (0, 1)),
+)
+
+
+def conventions_from_table(table) -> dict[str, Convention]:
+    """
+    Construct conventions from a declarative table.
+
+    Each row of the table is a tuple `(api, handedness, y_direction, (depth_min, depth_max))`.
+    The horizontal and vertical bounds of the canonical view volume are `[-1, 1]`. Each
+    convention is named after its API and handedness, such as `'vulkan_rh'`.
+
+    Parameters:
+    - table: An iterable of rows.
+
+    Returns:
+    - A dictionary mapping the name of each convention to the convention.
+    """
+    conventions = {}
+    for api, handedness, y_direction, (depth_min, depth_max) in table:
+        if handedness not in HANDEDNESSES:
+            raise ValueError(f'Expected a handedness in {HANDEDNESSES}, got {handedness!r}')
+        if y_direction not in Y_DIRECTIONS:
+            raise ValueError(f'Expected a y-direction in {Y_DIRECTIONS}, got {y_direction!r}')
+
+        name = f'{api}_{handedness[0]}h'
+        if name in conventions:
+            raise ValueError(f'Duplicate convention {name!r}')
+
+        ndc_bounds = NDCBounds(-1, 1, -1, 1, depth_min, depth_max)
+        conventions[name] = Convention(api, handedness, y_direction, ndc_bounds)
+
+    return conventions
+
+
+CONVENTIONS = conventions_from_table(CONVENTION_TABLE)
@@ -0,0 +1,180 @@
+import numpy as np
+
+from collections.abc import Callable
+
+from .derivation import ProjectionConstraints
+from .derivation import STANDARD
+from .projection_matrices import FrustumBounds
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+
+
+DEPTH_PROJECTIONS = ('perspective', 'orthographic')
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _map_depth(
+    depth: np.ndarray,
+    out: np.ndarray | None,
+    chunk_size: int,
+    func: Callable[[np.ndarray, np.ndarray], None]
+) -> np.ndarray:
+    # Apply `func(chunk, out_chunk)` to consecutive chunks of at most `chunk_size`
+    # values, so that arrays of any size, including memory mapped ones, are processed
+    # without temporary copies of the whole array. The output may alias the input.
+    depth = np.asanyarray(depth)
+    if out is None:
+        dtype = depth.dtype if np.issubdtype(depth.dtype, np.floating) else np.dtype(np.float64)
+        op_flags = [['readonly'], ['writeonly', 'allocate']]
+    else:
+        if out.shape != depth.shape:
+            raise ValueError(f'Expected an output array of shape {depth.shape}, got {out.shape}')
+        dtype = out.dtype
+        op_flags = [['readonly'], ['writeonly']]
+
+    iterator = np.nditer(
+        [depth, out],
+        flags=['external_loop', 'buffered', 'zerosize_ok'],
+        op_flags=op_flags,
+        op_dtypes=[dtype, dtype],
+        casting='same_kind',
+        buffersize=chunk_size
+    )
+    with iterator:
+        for chunk, out_chunk in iterator:
+            func(chunk, out_chunk)
+
+        result = iterator.operands[1]
+
+    return result if out is None else out
+
+
+def _depth_planes(ndc_bounds: NDCBounds, constraints: ProjectionConstraints) -> tuple[float, float]:
+    return float(getattr(ndc_bounds, constraints.near)), float(getattr(ndc_bounds, constraints.far))
+
+
+def linearize_depth(
+    depth: np.ndarray,
+    bounds: FrustumBounds | FrustumFovBounds,
+    ndc_bounds: NDCBounds,
+    constraints: ProjectionConstraints = STANDARD,
+    projection: str = 'perspective',
+    out: np.ndarray | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> np.ndarray:
+    """
+    Convert normalized device depth values into linear view space depth.
+
+    The depth values are the z-coordinates in normalized device coordinates of points
+    projected with a projection constructed with `bounds`, `ndc_bounds` and `constraints`,
+    such as the contents of a depth buffer. The result is the distance of each point
+    from the xy-plane of the canonical view space, which ranges from `near` to `far`.
+
+    Window space depth values of OpenGL lie in `[0, 1]` while its normalized device depth
+    values lie in `[-1, 1]`. Use `convert_depth` to re-encode them first.
+
+    The values are processed in chunks, so `depth` and `out` may be arrays of any size,
+    including `numpy.memmap` arrays of captured depth buffers. Pass `out=depth` to
+    linearize a buffer in place.
+
+    Parameters:
+    - depth: An array of normalized device depth values.
+    - bounds: The bounds of the frustum. Only the `near` and `far` fields are used, and
+      they must be numbers.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - constraints: The boundary conditions of the projection. They define which depth
+      bounds the near and far planes map to, for example with `REVERSED_Z`, and whether
+      the far plane is at infinity.
+    - projection: The kind of projection, one of `'perspective'` or `'orthographic'`.
+    - out: An optional array of the same shape as `depth` to write the result into.
+    - chunk_size: The number of values processed at a time.
+
+    Returns:
+    - An array of linear view space depths of the same shape as `depth`.
+    """
+    if projection not in DEPTH_PROJECTIONS:
+        raise ValueError(f'Expected a projection in {DEPTH_PROJECTIONS}, got {projection!r}')
+
+    n = float(bounds.near)
+    f = float(bounds.far)
+    near_depth, far_depth = _depth_planes(ndc_bounds, constraints)
+
+    if projection == 'orthographic':
+        if constraints.infinite_far:
+            raise ValueError('An orthographic projection cannot have an infinite far plane')
+
+        scale = (f - n) / (far_depth - near_depth)
+        offset = n - near_depth * scale
+
+        def func(chunk, out_chunk):
+            np.multiply(chunk, scale, out=out_chunk)
+            out_chunk += offset
+    else:
+        # The depth of a perspective projection is `alpha + beta / z`.
+        if constraints.infinite_far:
+            alpha = far_depth
+            beta = (near_depth - far_depth) * n
+        else:
+            alpha = (far_depth * f - near_depth * n) / (f - n)
+            beta = (near_depth - far_depth) * ((f * n) / (f - n))
+
+        def func(chunk, out_chunk):
+            np.subtract(chunk, alpha, out=out_chunk)
+            np.divide(beta, out_chunk, out=out_chunk)
+
+    return _map_depth(depth, out, chunk_size, func)
+
+
+def convert_depth(
+    depth: np.ndarray,
+    from_ndc_bounds: NDCBounds,
+    to_ndc_bounds: NDCBounds,
+    from_constraints: ProjectionConstraints = STANDARD,
+    to_constraints: ProjectionConstraints = STANDARD,
+    out: np.ndarray | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> np.ndarray:
+    """
+    Re-encode depth values between depth ranges and between standard and reversed depth.
+
+    For both perspective and orthographic projections, the depth values of two
+    projections of the same frustum that only differ in the depth bounds they map the
+    near and far planes to are related by an affine map. This function applies that map,
+    which covers the following conversions among others.
+
+    * Between the `[-1, 1]` depth range of OpenGL and the `[0, 1]` depth range of Vulkan,
+      DirectX and Metal, by changing the depth bounds of the NDC bounds.
+    * Between OpenGL normalized device depth and window space depth in `[0, 1]`.
+    * Between standard and reversed depth, with `STANDARD` and `REVERSED_Z` constraints.
+
+    The values are processed in chunks, so `depth` and `out` may be arrays of any size,
+    including `numpy.memmap` arrays of captured depth buffers. Pass `out=depth` to
+    convert a buffer in place.
+
+    Parameters:
+    - depth: An array of depth values.
+    - from_ndc_bounds: The normalized device coordinate bounds of the depth values.
+    - to_ndc_bounds: The normalized device coordinate bounds of the result.
+    - from_constraints: The boundary conditions of the projection of the depth values.
+    - to_constraints: The boundary conditions of the projection of the result. Both
+      constraints must agree on whether the far plane is at infinity.
+    - out: An optional array of the same shape as `depth` to write the result into.
+    - chunk_size: The number of values processed at a time.
+
+    Returns:
+    - An array of depth values of the same shape as `depth`.
+    """
+    if from_constraints.infinite_far != to_constraints.infinite_far:
+        raise ValueError('Expected constraints that agree on whether the far plane is at infinity')
+
+    from_near, from_far = _depth_planes(from_ndc_bounds, from_constraints)
+    to_near, to_far = _depth_planes(to_ndc_bounds, to_constraints)
+    scale = (to_far - to_near) / (from_far - from_near)
+    offset = to_near - from_near * scale
+
+    def func(chunk, out_chunk):
+        np.multiply(chunk, scale, out=out_chunk)
+        out_chunk += offset
+
+    return _map_depth(depth, out, chunk_size, func)
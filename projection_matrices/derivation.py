@@ -0,0 +1,198 @@
+import dataclasses
+import functools
+import sympy
+
+from dataclasses import dataclass
+
+from .instrumentation import instrumented
+from .projection_matrices import FrustumBounds
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+
+
+FRUSTUM_SYMBOLS = FrustumBounds(*sympy.symbols('l r b t n f', positive=True))
+
+FRUSTUM_FOV_SYMBOLS = FrustumFovBounds(*sympy.symbols('aspect_ratio vfov n f', positive=True))
+
+NDC_SYMBOLS = NDCBounds(*sympy.symbols('h_min h_max v_min v_max d_min d_max', real=True))
+
+PROJECTION_KINDS = ('perspective', 'perspective_fov', 'orthographic')
+
+
+@dataclass(frozen=True)
+class ProjectionConstraints:
+    """
+    A data class describing the boundary conditions of a projection.
+
+    Each plane of the viewing frustum is mapped to one of the fields of `NDCBounds`.
+    The **left** and **right** planes map to horizontal bounds, the **bottom** and **top**
+    planes map to vertical bounds, and the **near** and **far** planes map to depth bounds.
+    The default constraints are the ones used by `perspective`, `perspective_fov`, and
+    `orthographic`. When `infinite_far` is `True`, the **far plane** is moved to infinity,
+    and the `far` parameter of the frustum is ignored.
+    """
+    left: str = 'horizontal_min'
+    right: str = 'horizontal_max'
+    bottom: str = 'vertical_min'
+    top: str = 'vertical_max'
+    near: str = 'depth_min'
+    far: str = 'depth_max'
+    infinite_far: bool = False
+
+
+STANDARD = ProjectionConstraints()
+
+REVERSED_Z = ProjectionConstraints(near='depth_max', far='depth_min')
+
+INFINITE_FAR = ProjectionConstraints(infinite_far=True)
+
+REVERSED_Z_INFINITE_FAR = ProjectionConstraints(near='depth_max', far='depth_min', infinite_far=True)
+
+
+def _boundary_conditions(constraints: ProjectionConstraints) -> list:
+    # The points where the coordinate axes of the near plane cross the side planes of the
+    # frustum, and the points where the depth axis crosses the near and far planes.
+    l, r, b, t, n, f = dataclasses.astuple(FRUSTUM_SYMBOLS)
+
+    return [
+        (sympy.Matrix([-l, 0, n, 1]), 0, getattr(NDC_SYMBOLS, constraints.left)),
+        (sympy.Matrix([r, 0, n, 1]), 0, getattr(NDC_SYMBOLS, constraints.right)),
+        (sympy.Matrix([0, -b, n, 1]), 1, getattr(NDC_SYMBOLS, constraints.bottom)),
+        (sympy.Matrix([0, t, n, 1]), 1, getattr(NDC_SYMBOLS, constraints.top)),
+        (sympy.Matrix([0, 0, n, 1]), 2, getattr(NDC_SYMBOLS, constraints.near)),
+        (sympy.Matrix([0, 0, f, 1]), 2, getattr(NDC_SYMBOLS, constraints.far)),
+    ]
+
+
+def _derive_perspective(constraints: ProjectionConstraints) -> sympy.Matrix:
+    m00, m02, m11, m12, m22, m23 = sympy.symbols('m00 m02 m11 m12 m22 m23')
+    matrix = sympy.Matrix([
+        [m00, 0,   m02, 0  ],
+        [0,   m11, m12, 0  ],
+        [0,   0,   m22, m23],
+        [0,   0,   1,   0  ]
+    ])
+
+    return _solve(matrix, [m00, m02, m11, m12, m22, m23], _boundary_conditions(constraints), constraints)
+
+
+def _derive_orthographic(constraints: ProjectionConstraints) -> sympy.Matrix:
+    m00, m03, m11, m13, m22, m23 = sympy.symbols('m00 m03 m11 m13 m22 m23')
+    matrix = sympy.Matrix([
+        [m00, 0,   0,   m03],
+        [0,   m11, 0,   m13],
+        [0,   0,   m22, m23],
+        [0,   0,   0,   1  ]
+    ])
+
+    return _solve(matrix, [m00, m03, m11, m13, m22, m23], _boundary_conditions(constraints), constraints)
+
+
+def _solve(
+    matrix: sympy.Matrix,
+    unknowns: list[sympy.Symbol],
+    conditions: list,
+    constraints: ProjectionConstraints
+) -> sympy.Matrix:
+    # Each condition states that a point in view space lands on an NDC bound after the
+    # perspective division. Multiplying through by `w` makes every condition linear in
+    # the unknown entries of the matrix.
+    equations = []
+    for point, axis, ndc_value in conditions:
+        clip = matrix * point
+        equations.append(sympy.Eq(clip[axis], ndc_value * clip[3]))
+
+    solution = sympy.solve(equations, unknowns, dict=True)[0]
+    result = matrix.xreplace(solution)
+    if constraints.infinite_far:
+        result = result.applyfunc(lambda entry: sympy.limit(entry, FRUSTUM_SYMBOLS.far, sympy.oo))
+
+    return result.applyfunc(sympy.factor)
+
+
+@instrumented()
+@functools.cache
+def derive_projection(kind: str, constraints: ProjectionConstraints = STANDARD) -> sympy.Matrix:
+    """
+    Derive the closed form of a projection in the canonical orthonormal frames from its
+    boundary conditions.
+
+    The matrix is solved for symbolically from the conditions that the planes of the
+    viewing frustum map to the bounds of the canonical view volume given by `constraints`,
+    and simplified once. An orthographic projection cannot have a far plane at infinity,
+    since its depth mapping is affine. The closed form is expressed in terms of the symbols in
+    `FRUSTUM_SYMBOLS` (or `FRUSTUM_FOV_SYMBOLS` for a `perspective_fov` projection) and
+    `NDC_SYMBOLS`. The result is cached per projection kind and constraint set, so later
+    calls return immediately.
+
+    Parameters:
+    - kind: The kind of projection, one of `'perspective'`, `'perspective_fov'`, or
+      `'orthographic'`.
+    - constraints: The boundary conditions of the projection.
+
+    Returns:
+    - A 4x4 projection matrix in closed form.
+    """
+    if kind == 'perspective':
+        return sympy.ImmutableMatrix(_derive_perspective(constraints))
+    elif kind == 'orthographic':
+        if constraints.infinite_far:
+            raise ValueError('An orthographic projection cannot have a far plane at infinity')
+
+        return sympy.ImmutableMatrix(_derive_orthographic(constraints))
+    elif kind == 'perspective_fov':
+        aspect_ratio, vfov, n, f = (
+            FRUSTUM_FOV_SYMBOLS.aspect_ratio, FRUSTUM_FOV_SYMBOLS.vfov,
+            FRUSTUM_FOV_SYMBOLS.near, FRUSTUM_FOV_SYMBOLS.far
+        )
+        top = n * sympy.tan(vfov / 2)
+        right = aspect_ratio * top
+        substitution = {
+            FRUSTUM_SYMBOLS.left: right,
+            FRUSTUM_SYMBOLS.right: right,
+            FRUSTUM_SYMBOLS.bottom: top,
+            FRUSTUM_SYMBOLS.top: top,
+            FRUSTUM_SYMBOLS.near: n,
+            FRUSTUM_SYMBOLS.far: f,
+        }
+        matrix = derive_projection('perspective', constraints).xreplace(substitution)
+
+        return sympy.ImmutableMatrix(matrix.applyfunc(sympy.factor))
+    else:
+        raise ValueError(f'Expected a projection kind in {PROJECTION_KINDS}, got {kind!r}')
+
+
+@instrumented()
+def instantiate_projection(
+    kind: str,
+    bounds: FrustumBounds | FrustumFovBounds,
+    ndc_bounds: NDCBounds,
+    constraints: ProjectionConstraints = STANDARD
+) -> sympy.Matrix:
+    """
+    Generate an instance of a projection in the canonical orthonormal frames from its
+    derived closed form.
+
+    The closed form is derived by `derive_projection` on first use, so every later call
+    with the same projection kind and constraint set is a substitution of the parameters
+    into the closed form.
+
+    Parameters:
+    - kind: The kind of projection, one of `'perspective'`, `'perspective_fov'`, or
+      `'orthographic'`.
+    - bounds: The bounds of the frustum. This is a `FrustumFovBounds` for a
+      `perspective_fov` projection, and a `FrustumBounds` otherwise.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - constraints: The boundary conditions of the projection.
+
+    Returns:
+    - A 4x4 projection matrix.
+    """
+    matrix = derive_projection(kind, constraints)
+    frustum_symbols = FRUSTUM_FOV_SYMBOLS if kind == 'perspective_fov' else FRUSTUM_SYMBOLS
+    substitution = {}
+    for symbols, values in ((frustum_symbols, bounds), (NDC_SYMBOLS, ndc_bounds)):
+        for field in dataclasses.fields(symbols):
+            substitution[getattr(symbols, field.name)] = sympy.sympify(getattr(values, field.name))
+
+    return sympy.Matrix(matrix.xreplace(substitution))
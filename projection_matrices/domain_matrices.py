@@ -0,0 +1,144 @@
+import sympy
+
+from sympy.polys.constructor import construct_domain
+from sympy.polys.domains import QQ
+from sympy.polys.domains.domain import Domain
+from sympy.polys.matrices import DomainMatrix
+
+from .instrumentation import instrumented
+from .projection_matrices import FrustumBounds
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+from .projection_matrices import perspective, perspective_fov, orthographic
+
+
+@instrumented()
+def to_domain_matrix(matrix: sympy.Matrix, domain: Domain | None = None) -> DomainMatrix:
+    """
+    Convert a sympy matrix into a domain matrix over a field of rational functions.
+
+    Every entry of a projection matrix constructed by this library is a rational
+    function in the frustum parameters and the normalized device coordinate bounds.
+    When `domain` is not specified, the entries are converted into elements of the
+    rational function field `QQ(x_1, ..., x_k)`, where `x_1, ..., x_k` are the generators
+    occurring in the entries of the matrix. A generator is either a symbol, or a
+    non-rational subexpression such as `tan(vfov / 2)`. A matrix with only rational
+    entries is converted into a matrix over `QQ`. Floating point entries are converted
+    into the rational numbers they represent exactly. When the entries contain algebraic
+    numbers such as `tan(pi / 6) = sqrt(3) / 3`, they are kept in the domain chosen by
+    `construct_domain`, which is usually the expression domain `EX`.
+
+    Matrix multiplication, inversion and equality of domain matrices run in the
+    polynomial domain, which is significantly faster than the same operations on
+    general sympy expressions, and keeps the entries in canonical form. Two domain
+    matrices over different domains can be brought into a common domain using
+    `DomainMatrix.unify`.
+
+    Parameters:
+    - matrix: The matrix to convert.
+    - domain: The domain to convert the entries into. When `None`, the domain is
+      constructed from the entries of the matrix.
+
+    Returns:
+    - A domain matrix with the same shape and entries as `matrix`.
+    """
+    rows, cols = matrix.shape
+    entries = [
+        entry.xreplace({number: sympy.Rational(number) for number in entry.atoms(sympy.Float)})
+        for entry in matrix
+    ]
+    if domain is None:
+        domain, elements = construct_domain(entries, field=True)
+        if domain.is_Composite:
+            field = QQ.frac_field(*domain.symbols)
+            elements = [field.convert_from(element, domain) for element in elements]
+            domain = field
+        elif domain.is_ZZ or domain.is_QQ:
+            elements = [QQ.convert_from(element, domain) for element in elements]
+            domain = QQ
+    else:
+        elements = [domain.from_sympy(entry) for entry in entries]
+
+    rep = [elements[row * cols:(row + 1) * cols] for row in range(rows)]
+
+    return DomainMatrix(rep, (rows, cols), domain)
+
+
+def perspective_domain(
+    frustum_bounds: FrustumBounds,
+    ndc_bounds: NDCBounds,
+    domain: Domain | None = None
+) -> DomainMatrix:
+    """
+    Generate an instance of a perspective projection in the canonical orthonormal frames
+    as a domain matrix.
+
+    See `perspective` for the definition of the canonical orthonormal frames and the
+    parametrization of the frustum. Conversion back to a sympy matrix with
+    `DomainMatrix.to_Matrix` is lossless.
+
+    Parameters:
+    - frustum_bounds: The bounds of the frustum defined in terms of relative displacements
+      along the coordinate axes.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - domain: The domain of the entries of the matrix. When `None`, the domain is the field
+      of rational functions in the parameters.
+
+    Returns:
+    - A 4x4 perspective projection matrix over a field of rational functions.
+    """
+    return to_domain_matrix(perspective(frustum_bounds, ndc_bounds), domain)
+
+
+def orthographic_domain(
+    frustum_bounds: FrustumBounds,
+    ndc_bounds: NDCBounds,
+    domain: Domain | None = None
+) -> DomainMatrix:
+    """
+    Generate an instance of a orthographic projection in the canonical orthonormal frames
+    as a domain matrix.
+
+    See `orthographic` for the definition of the canonical orthonormal frames and the
+    parametrization of the frustum. Conversion back to a sympy matrix with
+    `DomainMatrix.to_Matrix` is lossless.
+
+    Parameters:
+    - frustum_bounds: The bounds of the frustum defined in terms of relative displacements
+      along the coordinate axes.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - domain: The domain of the entries of the matrix. When `None`, the domain is the field
+      of rational functions in the parameters.
+
+    Returns:
+    - A 4x4 orthographic projection matrix over a field of rational functions.
+    """
+    return to_domain_matrix(orthographic(frustum_bounds, ndc_bounds), domain)
+
+
+def perspective_fov_domain(
+    frustum_fov_bounds: FrustumFovBounds,
+    ndc_bounds: NDCBounds,
+    domain: Domain | None = None
+) -> DomainMatrix:
+    """
+    Generate an instance of a perspective projection in the canonical orthonormal frames
+    as a domain matrix.
+
+    See `perspective_fov` for the definition of the canonical orthonormal frames and the
+    parametrization of the frustum. The entries of the matrix are rational functions in
+    `aspect_ratio`, `near`, `far`, the normalized device coordinate bounds, and
+    `tan(vfov / 2)`, which is treated as a generator of the field. Conversion back to a
+    sympy matrix with `DomainMatrix.to_Matrix` is lossless.
+
+    Parameters:
+    - frustum_fov_bounds: The bounds of the frustum defined in terms of the vertical field
+      of view and aspect ratio.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - domain: The domain of the entries of the matrix. When `None`, the domain is the field
+      of rational functions in the parameters.
+
+    Returns:
+    - A 4x4 perspective projection matrix over a field of rational functions.
+    """
+    return to_domain_matrix(perspective_fov(frustum_fov_bounds, ndc_bounds), domain)
@@ -0,0 +1,212 @@
+import atexit
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+
+import sympy
+
+from collections.abc import Callable, Iterator
+
+
+PROFILE_ENVIRONMENT_VARIABLE = 'PROJECTION_MATRICES_PROFILE'
+
+TRACE_ENVIRONMENT_VARIABLE = 'PROJECTION_MATRICES_TRACE'
+
+
+class _Profile:
+    def __init__(self):
+        self.enabled = False
+        self.record_trace = False
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def record(self, name: str, start: float, elapsed: float, ops: int | None) -> None:
+        with self.lock:
+            stats = self.stats.setdefault(name, {
+                'calls': 0, 'total_time': 0.0, 'max_time': 0.0, 'total_ops': 0, 'max_ops': 0
+            })
+
+            stats['calls'] += 1
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+            if ops is not None:
+                stats['total_ops'] += ops
+                stats['max_ops'] = max(stats['max_ops'], ops)
+
+            if self.record_trace:
+                self.events.append({
+                    'name': name,
+                    'ph': 'X',
+                    'ts': (start - self.origin) * 1e6,
+                    'dur': elapsed * 1e6,
+                    'pid': os.getpid(),
+                    'tid': threading.get_ident(),
+                    'args': {} if ops is None else {'ops': ops},
+                })
+
+
+_profile = _Profile()
+
+
+def _count_ops(value) -> int | None:
+    if isinstance(value, sympy.MatrixBase):
+        return sum(sympy.count_ops(entry) for entry in value)
+    elif isinstance(value, sympy.Basic):
+        return sympy.count_ops(value)
+    else:
+        return None
+
+
+def instrumented(name: str | None = None) -> Callable:
+    """
+    Instrument a library entry point.
+
+    While profiling is enabled, every call of the decorated function records its wall
+    time, and the expression tree size of its result as measured by `sympy.count_ops`
+    when the result is a sympy expression or matrix. While profiling is disabled, the
+    decorated function is called directly. The `cache_info`, `cache_clear`, and
+    `cache_parameters` methods of a function decorated with `functools.cache` or
+    `functools.lru_cache` are exposed by the decorated function.
+
+    Parameters:
+    - name: The name of the entry point in the profile. When `None`, it is the qualified
+      name of the function.
+
+    Returns:
+    - A decorator.
+    """
+    def decorator(func: Callable) -> Callable:
+        entry_point = func.__qualname__ if name is None else name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profile.enabled:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            _profile.record(entry_point, start, elapsed, _count_ops(result))
+
+            return result
+
+        for attribute in ('cache_info', 'cache_clear', 'cache_parameters'):
+            if hasattr(func, attribute):
+                setattr(wrapper, attribute, getattr(func, attribute))
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def timed(name: str) -> Iterator[None]:
+    """
+    Record the wall time of a block of code under `name` while profiling is enabled.
+
+    This measures work outside of the library entry points, such as calls to
+    `sympy.simplify` or `Matrix.equals` when composing conventions.
+    """
+    if not _profile.enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _profile.record(name, start, time.perf_counter() - start, None)
+
+
+def enable_profiling(trace: bool = False) -> None:
+    """
+    Enable profiling of the library entry points.
+
+    Parameters:
+    - trace: Whether to record every call as a trace event for `write_trace`.
+    """
+    _profile.record_trace = trace
+    _profile.enabled = True
+
+
+def disable_profiling() -> None:
+    """
+    Disable profiling of the library entry points. The recorded statistics are kept.
+    """
+    _profile.enabled = False
+
+
+def reset_profile() -> None:
+    """
+    Discard the recorded statistics and trace events.
+    """
+    with _profile.lock:
+        _profile.stats = {}
+        _profile.events = []
+
+
+def profile_stats() -> dict:
+    """
+    Return the aggregated statistics recorded for each entry point.
+
+    The statistics of each entry point are the following.
+
+    * `calls` is the number of calls.
+    * `total_time` and `max_time` are the total and the largest wall time of a call in seconds.
+    * `mean_time` is the mean wall time of a call in seconds.
+    * `total_ops` and `max_ops` are the total and the largest expression tree size of a result.
+    """
+    with _profile.lock:
+        return {
+            name: dict(stats, mean_time=stats['total_time'] / stats['calls'])
+            for name, stats in _profile.stats.items()
+        }
+
+
+def write_trace(path: str) -> None:
+    """
+    Write the recorded trace events to a file in the Chrome trace event format, which can
+    be opened in `chrome://tracing` or Perfetto.
+    """
+    with _profile.lock:
+        events = list(_profile.events)
+
+    with open(path, 'w') as file:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+
+@contextlib.contextmanager
+def profiling(trace_file: str | None = None) -> Iterator[dict]:
+    """
+    Profile the library entry points called inside a block of code.
+
+    The statistics recorded before the block are discarded. The context manager yields a
+    dictionary that is filled with the result of `profile_stats` when the block exits.
+
+    Parameters:
+    - trace_file: An optional path to write the trace events of the block to.
+    """
+    stats = {}
+    was_enabled = _profile.enabled
+    was_tracing = _profile.record_trace
+    reset_profile()
+    enable_profiling(trace=trace_file is not None)
+    try:
+        yield stats
+    finally:
+        _profile.enabled = was_enabled
+        _profile.record_trace = was_tracing
+        stats.update(profile_stats())
+        if trace_file is not None:
+            write_trace(trace_file)
+
+
+if os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, '').lower() not in ('', '0', 'false', 'no'):
+    enable_profiling(trace=TRACE_ENVIRONMENT_VARIABLE in os.environ)
+    if TRACE_ENVIRONMENT_VARIABLE in os.environ:
+        atexit.register(write_trace, os.environ[TRACE_ENVIRONMENT_VARIABLE])
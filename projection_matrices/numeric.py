@@ -0,0 +1,187 @@
+import numpy as np
+
+from .conventions import Convention
+from .projection_matrices import FrustumBounds
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+
+
+def _broadcast_parameters(*parameters, dtype) -> list[np.ndarray]:
+    return np.broadcast_arrays(*(np.asarray(parameter, dtype=dtype) for parameter in parameters))
+
+
+def _output_array(shape: tuple, dtype, out: np.ndarray | None) -> np.ndarray:
+    if out is None:
+        return np.zeros(shape + (4, 4), dtype=dtype)
+
+    if out.shape != shape + (4, 4):
+        raise ValueError(f'Expected an output array of shape {shape + (4, 4)}, got {out.shape}')
+
+    out[...] = 0
+
+    return out
+
+
+def perspective_array(
+    frustum_bounds: FrustumBounds,
+    ndc_bounds: NDCBounds,
+    out: np.ndarray | None = None,
+    dtype=np.float64
+) -> np.ndarray:
+    """
+    Evaluate a batch of perspective projections in the canonical orthonormal frames.
+
+    This is the numerical counterpart of `perspective`. The fields of `frustum_bounds`
+    and `ndc_bounds` are numbers or arrays of numbers, which are broadcast against each
+    other. For a batch of frustums of shape `S`, the result has shape `S + (4, 4)`, and
+    the entry `[..., i, j]` is the entry in row `i` and column `j` of the corresponding
+    projection matrix.
+
+    Parameters:
+    - frustum_bounds: The bounds of the frustum defined in terms of relative displacements
+      along the coordinate axes.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - out: An optional array of shape `S + (4, 4)` to write the matrices into.
+    - dtype: The floating point type of the result when `out` is not specified.
+
+    Returns:
+    - An array of 4x4 perspective projection matrices.
+    """
+    l, r, b, t, n, f, h_min, h_max, v_min, v_max, d_min, d_max = _broadcast_parameters(
+        frustum_bounds.left, frustum_bounds.right, frustum_bounds.bottom,
+        frustum_bounds.top, frustum_bounds.near, frustum_bounds.far,
+        ndc_bounds.horizontal_min, ndc_bounds.horizontal_max,
+        ndc_bounds.vertical_min, ndc_bounds.vertical_max,
+        ndc_bounds.depth_min, ndc_bounds.depth_max,
+        dtype=np.float64
+    )
+    matrix = _output_array(l.shape, dtype, out)
+
+    matrix[..., 0, 0] = ((h_max - h_min) * n) / (r + l)
+    matrix[..., 0, 2] = (h_min * r + h_max * l) / (r + l)
+    matrix[..., 1, 1] = ((v_max - v_min) * n) / (t + b)
+    matrix[..., 1, 2] = (v_min * t + v_max * b) / (t + b)
+    matrix[..., 2, 2] = (d_max * f - d_min * n) / (f - n)
+    matrix[..., 2, 3] = -((d_max - d_min) * f * n) / (f - n)
+    matrix[..., 3, 2] = 1
+
+    return matrix
+
+
+def orthographic_array(
+    frustum_bounds: FrustumBounds,
+    ndc_bounds: NDCBounds,
+    out: np.ndarray | None = None,
+    dtype=np.float64
+) -> np.ndarray:
+    """
+    Evaluate a batch of orthographic projections in the canonical orthonormal frames.
+
+    This is the numerical counterpart of `orthographic`. The fields of `frustum_bounds`
+    and `ndc_bounds` are numbers or arrays of numbers, which are broadcast against each
+    other. For a batch of frustums of shape `S`, the result has shape `S + (4, 4)`.
+
+    Parameters:
+    - frustum_bounds: The bounds of the frustum defined in terms of relative displacements
+      along the coordinate axes.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - out: An optional array of shape `S + (4, 4)` to write the matrices into.
+    - dtype: The floating point type of the result when `out` is not specified.
+
+    Returns:
+    - An array of 4x4 orthographic projection matrices.
+    """
+    l, r, b, t, n, f, h_min, h_max, v_min, v_max, d_min, d_max = _broadcast_parameters(
+        frustum_bounds.left, frustum_bounds.right, frustum_bounds.bottom,
+        frustum_bounds.top, frustum_bounds.near, frustum_bounds.far,
+        ndc_bounds.horizontal_min, ndc_bounds.horizontal_max,
+        ndc_bounds.vertical_min, ndc_bounds.vertical_max,
+        ndc_bounds.depth_min, ndc_bounds.depth_max,
+        dtype=np.float64
+    )
+    matrix = _output_array(l.shape, dtype, out)
+
+    matrix[..., 0, 0] = (h_max - h_min) / (r + l)
+    matrix[..., 0, 3] = (h_min * r + h_max * l) / (r + l)
+    matrix[..., 1, 1] = (v_max - v_min) / (t + b)
+    matrix[..., 1, 3] = (v_min * t + v_max * b) / (t + b)
+    matrix[..., 2, 2] = (d_max - d_min) / (f - n)
+    matrix[..., 2, 3] = (d_min * f - d_max * n) / (f - n)
+    matrix[..., 3, 3] = 1
+
+    return matrix
+
+
+def perspective_fov_array(
+    frustum_fov_bounds: FrustumFovBounds,
+    ndc_bounds: NDCBounds,
+    out: np.ndarray | None = None,
+    dtype=np.float64
+) -> np.ndarray:
+    """
+    Evaluate a batch of perspective projections in the canonical orthonormal frames.
+
+    This is the numerical counterpart of `perspective_fov`. The fields of
+    `frustum_fov_bounds` and `ndc_bounds` are numbers or arrays of numbers, which are
+    broadcast against each other. The vertical field of view is given in radians. For a
+    batch of frustums of shape `S`, the result has shape `S + (4, 4)`.
+
+    Parameters:
+    - frustum_fov_bounds: The bounds of the frustum defined in terms of the vertical field
+      of view and aspect ratio.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates.
+    - out: An optional array of shape `S + (4, 4)` to write the matrices into.
+    - dtype: The floating point type of the result when `out` is not specified.
+
+    Returns:
+    - An array of 4x4 perspective projection matrices.
+    """
+    aspect_ratio, theta_vfov, n, f, h_min, h_max, v_min, v_max, d_min, d_max = _broadcast_parameters(
+        frustum_fov_bounds.aspect_ratio, frustum_fov_bounds.vfov,
+        frustum_fov_bounds.near, frustum_fov_bounds.far,
+        ndc_bounds.horizontal_min, ndc_bounds.horizontal_max,
+        ndc_bounds.vertical_min, ndc_bounds.vertical_max,
+        ndc_bounds.depth_min, ndc_bounds.depth_max,
+        dtype=np.float64
+    )
+    matrix = _output_array(aspect_ratio.shape, dtype, out)
+    cot_half_vfov = 1 / np.tan(theta_vfov / 2)
+
+    matrix[..., 0, 0] = ((h_max - h_min) / (2 * aspect_ratio)) * cot_half_vfov
+    matrix[..., 0, 2] = (h_max + h_min) / 2
+    matrix[..., 1, 1] = ((v_max - v_min) / 2) * cot_half_vfov
+    matrix[..., 1, 2] = (v_max + v_min) / 2
+    matrix[..., 2, 2] = (d_max * f - d_min * n) / (f - n)
+    matrix[..., 2, 3] = -(d_max - d_min) * ((f * n) / (f - n))
+    matrix[..., 3, 2] = 1
+
+    return matrix
+
+
+def apply_convention_array(convention: Convention, matrices: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Convert a batch of projection matrices in the canonical orthonormal frames into
+    projection matrices in a convention.
+
+    This is the numerical counterpart of `Convention.apply`.
+
+    Parameters:
+    - convention: The target convention.
+    - matrices: An array of 4x4 projection matrices of shape `S + (4, 4)`.
+    - out: An optional array of shape `S + (4, 4)` to write the matrices into. It may be
+      the same array as `matrices`.
+
+    Returns:
+    - An array of 4x4 projection matrices in the convention.
+    """
+    clip_transform = np.array(convention.clip_transform().tolist(), dtype=matrices.dtype)
+    view_transform = np.array(convention.view_transform().tolist(), dtype=matrices.dtype)
+
+    return np.matmul(clip_transform, matrices @ view_transform, out=out)
+
+
+PROJECTIONS = {
+    'perspective': (FrustumBounds, perspective_array),
+    'perspective_fov': (FrustumFovBounds, perspective_fov_array),
+    'orthographic': (FrustumBounds, orthographic_array),
+}
@@ -0,0 +1,106 @@
+import numpy as np
+import sympy
+
+from .instrumentation import instrumented
+from .projection_matrices import NDCBounds
+
+
+@instrumented()
+def oblique_projection(matrix: sympy.Matrix, ndc_bounds: NDCBounds, plane: sympy.Matrix) -> sympy.Matrix:
+    """
+    Replace the near plane of a projection by an arbitrary clip plane.
+
+    This is Lengyel's oblique near-plane clipping technique, generalized to canonical
+    view volumes with an arbitrary depth range. The projection `matrix` is a projection
+    in the canonical orthonormal frames constructed by this library with `ndc_bounds`.
+    The clip plane `plane = [a, b, c, d]^T` is given in view space, and the points
+    `[x, y, z]^T` with `a * x + b * y + c * z + d >= 0` are on its visible side. The
+    camera at the origin must lie strictly on the invisible side, that is, `d < 0`.
+
+    The third row of the result is chosen such that points on the clip plane map to
+    `ndc_bounds.depth_min`, and the far plane passes through the corner of the view
+    frustum opposite to the clip plane, which keeps as much depth precision as
+    possible. The other rows of `matrix` are unchanged. When the position of the clip
+    plane relative to the view frustum cannot be decided symbolically, the corner is
+    expressed with piecewise entries.
+
+    Parameters:
+    - matrix: A 4x4 projection matrix in the canonical orthonormal frames.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates
+      used to construct `matrix`.
+    - plane: The clip plane in view space as a 4x1 matrix or a sequence of four entries.
+
+    Returns:
+    - A 4x4 oblique projection matrix.
+    """
+    plane = sympy.Matrix(plane).reshape(4, 1)
+    h_min = ndc_bounds.horizontal_min
+    h_max = ndc_bounds.horizontal_max
+    v_min = ndc_bounds.vertical_min
+    v_max = ndc_bounds.vertical_max
+    plane_clip = matrix.T.LUsolve(plane)
+    # The corner of the view volume farthest from the clip plane lies on the side of each
+    # axis the clip plane faces, regardless of the order of the bounds along that axis.
+    corner_clip = sympy.Matrix([
+        sympy.Piecewise((sympy.Max(h_min, h_max), plane_clip[0] >= 0), (sympy.Min(h_min, h_max), True)),
+        sympy.Piecewise((sympy.Max(v_min, v_max), plane_clip[1] >= 0), (sympy.Min(v_min, v_max), True)),
+        ndc_bounds.depth_max,
+        1
+    ])
+    corner = matrix.LUsolve(corner_clip)
+    w_row = matrix[3, :]
+    scale = (ndc_bounds.depth_max - ndc_bounds.depth_min) * (w_row * corner)[0] / (plane.T * corner)[0]
+
+    result = matrix.copy()
+    result[2, :] = sympy.simplify(scale * plane.T + ndc_bounds.depth_min * w_row)
+
+    return result
+
+
+def oblique_projection_array(matrices: np.ndarray, ndc_bounds: NDCBounds, planes: np.ndarray) -> np.ndarray:
+    """
+    Replace the near planes of a batch of projections by arbitrary clip planes.
+
+    This is the vectorized counterpart of `oblique_projection`. The matrices and the
+    planes are broadcast against each other, so a single projection can be combined with
+    many clip planes, for example one for each portal or mirror in a frame. For a batch
+    of matrices of shape `S + (4, 4)` and a batch of planes of shape `T + (4,)`, the
+    result has shape `B + (4, 4)`, where `B` is the broadcast of `S` and `T`.
+
+    Parameters:
+    - matrices: An array of projection matrices of shape `S + (4, 4)`, such as a single
+      4x4 matrix or a batch of shape `(N, 4, 4)`, in the canonical orthonormal frames.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates
+      used to construct the matrices.
+    - planes: An array of clip planes of shape `T + (4,)`, such as a single plane of shape
+      `(4,)` or a batch of shape `(N, 4)`, in view space.
+
+    Returns:
+    - An array of oblique projection matrices of shape `B + (4, 4)`. A single matrix and a
+      single plane give a 4x4 array.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64)
+    planes = np.asarray(planes, dtype=np.float64)
+    shape = np.broadcast_shapes(matrices.shape[:-2], planes.shape[:-1])
+    matrices = np.broadcast_to(matrices, shape + (4, 4))
+    planes = np.broadcast_to(planes, shape + (4,))
+
+    plane_clip = np.linalg.solve(matrices.swapaxes(-1, -2), planes[..., None])[..., 0]
+    h_bounds = sorted((float(ndc_bounds.horizontal_min), float(ndc_bounds.horizontal_max)))
+    v_bounds = sorted((float(ndc_bounds.vertical_min), float(ndc_bounds.vertical_max)))
+    corner_clip = np.empty(shape + (4,), dtype=np.float64)
+    corner_clip[..., 0] = np.where(plane_clip[..., 0] >= 0, h_bounds[1], h_bounds[0])
+    corner_clip[..., 1] = np.where(plane_clip[..., 1] >= 0, v_bounds[1], v_bounds[0])
+    corner_clip[..., 2] = float(ndc_bounds.depth_max)
+    corner_clip[..., 3] = 1
+    corner = np.linalg.solve(matrices, corner_clip[..., None])[..., 0]
+
+    d_min = float(ndc_bounds.depth_min)
+    d_max = float(ndc_bounds.depth_max)
+    w_rows = matrices[..., 3, :]
+    scale = (d_max - d_min) * np.sum(w_rows * corner, axis=-1) / np.sum(planes * corner, axis=-1)
+
+    result = matrices.copy()
+    result[..., 2, :] = scale[..., None] * planes + d_min * w_rows
+
+    return result
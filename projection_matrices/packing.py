@@ -0,0 +1,176 @@
+import numpy as np
+import sympy
+
+from .composition import LAYOUTS
+
+
+BLOCK_LAYOUTS = ('packed', 'std140', 'std430')
+
+
+def _round_up(value: int, alignment: int) -> int:
+    return -(-value // alignment) * alignment
+
+
+def matrix_layout(block_layout: str = 'std140', dtype=np.float32) -> tuple[int, int]:
+    """
+    Compute the column stride and the base alignment of a 4x4 matrix in a buffer.
+
+    In the `'std140'` layout, each column of a matrix is a four component vector whose
+    stride is rounded up to 16 bytes. In the `'std430'` layout, each column is a four
+    component vector without rounding. In the `'packed'` layout, the entries are tightly
+    packed with no alignment beyond the size of an entry. For `float32` and `float64`
+    entries, the three layouts have the same column stride.
+
+    Parameters:
+    - block_layout: The layout of the buffer, one of `'packed'`, `'std140'`, or `'std430'`.
+    - dtype: The floating point type of the entries, one of `float16`, `float32`, or `float64`.
+
+    Returns:
+    - The stride in bytes between consecutive columns (or rows) of a matrix, and the
+      alignment in bytes of the start of a matrix.
+    """
+    if block_layout not in BLOCK_LAYOUTS:
+        raise ValueError(f'Expected a block layout in {BLOCK_LAYOUTS}, got {block_layout!r}')
+
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float16, np.float32, np.float64):
+        raise ValueError(f'Expected a float16, float32, or float64 entry type, got {dtype}')
+
+    vector_size = 4 * dtype.itemsize
+    if block_layout == 'std140':
+        column_stride = _round_up(vector_size, 16)
+        return column_stride, column_stride
+    elif block_layout == 'std430':
+        return vector_size, vector_size
+    else:
+        return vector_size, dtype.itemsize
+
+
+def packed_size(count: int, block_layout: str = 'std140', dtype=np.float32, matrix_stride: int | None = None) -> int:
+    """
+    Compute the number of bytes occupied by `count` matrices packed with `pack_matrices`.
+
+    Parameters:
+    - count: The number of matrices.
+    - block_layout: The layout of the buffer, one of `'packed'`, `'std140'`, or `'std430'`.
+    - dtype: The floating point type of the entries.
+    - matrix_stride: The stride in bytes between consecutive matrices. When `None`, the
+      matrices are stored contiguously.
+
+    Returns:
+    - The size in bytes of the packed matrices.
+    """
+    column_stride, _ = matrix_layout(block_layout, dtype)
+    if matrix_stride is None:
+        matrix_stride = 4 * column_stride
+
+    return 0 if count == 0 else (count - 1) * matrix_stride + 4 * column_stride
+
+
+def packed_view(
+    buffer,
+    count: int,
+    offset: int = 0,
+    block_layout: str = 'std140',
+    order: str = 'column_major',
+    dtype=np.float32,
+    matrix_stride: int | None = None
+) -> np.ndarray:
+    """
+    Construct a writable view of `count` packed 4x4 matrices in a buffer.
+
+    The entry `view[i, r, c]` of the result is the entry in row `r` and column `c` of the
+    i-th matrix, wherever `block_layout` and `order` place it in the buffer. Assigning to
+    the view writes directly into the buffer. See `pack_matrices` for a description of
+    the parameters.
+
+    Returns:
+    - A strided array of shape `(count, 4, 4)` backed by `buffer`.
+    """
+    if order not in LAYOUTS:
+        raise ValueError(f'Expected an order in {LAYOUTS}, got {order!r}')
+
+    dtype = np.dtype(dtype)
+    column_stride, alignment = matrix_layout(block_layout, dtype)
+    if matrix_stride is None:
+        matrix_stride = 4 * column_stride
+
+    if offset < 0 or offset % alignment != 0:
+        raise ValueError(f'Expected a non-negative offset aligned to {alignment} bytes, got {offset}')
+    if matrix_stride < 4 * column_stride or matrix_stride % alignment != 0:
+        raise ValueError(f'Expected a matrix stride of at least {4 * column_stride} bytes '
+                         f'aligned to {alignment} bytes, got {matrix_stride}')
+
+    memory = memoryview(buffer).cast('B')
+    if memory.readonly:
+        raise ValueError('Expected a writable buffer')
+
+    end = offset + packed_size(count, block_layout, dtype, matrix_stride)
+    if end > memory.nbytes:
+        raise ValueError(f'Expected a buffer of at least {end} bytes, got {memory.nbytes}')
+
+    if order == 'column_major':
+        strides = (matrix_stride, dtype.itemsize, column_stride)
+    else:
+        strides = (matrix_stride, column_stride, dtype.itemsize)
+
+    return np.ndarray(
+        shape=(count, 4, 4),
+        dtype=dtype.newbyteorder('<'),
+        buffer=memory,
+        offset=offset,
+        strides=strides
+    )
+
+
+def pack_matrices(
+    matrices: sympy.Matrix | np.ndarray,
+    buffer,
+    offset: int = 0,
+    block_layout: str = 'std140',
+    order: str = 'column_major',
+    dtype=np.float32,
+    matrix_stride: int | None = None
+) -> int:
+    """
+    Write one or more 4x4 matrices directly into a buffer for upload to a GPU.
+
+    The buffer is any writable object supporting the buffer protocol, such as a
+    `bytearray`, a writable `memoryview`, a `mmap`, or a contiguous numpy array. The
+    matrices are converted to `dtype` and written in place through a strided view of the
+    buffer, so no intermediate copies of the matrices are made.
+
+    With the `'column_major'` order, each matrix is written column by column, matching
+    the default matrix layout of GLSL, HLSL `column_major`, and Metal. With the
+    `'row_major'` order, each matrix is written row by row.
+
+    Parameters:
+    - matrices: A 4x4 matrix, or an array of matrices of shape `(N, 4, 4)`. A sympy
+      matrix must have numerical entries.
+    - buffer: The writable buffer to write the matrices into.
+    - offset: The byte offset of the first matrix in the buffer. It must be a multiple
+      of the base alignment of a matrix in `block_layout`.
+    - block_layout: The layout of the buffer, one of `'packed'`, `'std140'`, or `'std430'`.
+    - order: The order of the entries of each matrix, one of `'row_major'` or `'column_major'`.
+    - dtype: The floating point type of the entries, one of `float16`, `float32`, or `float64`.
+    - matrix_stride: The stride in bytes between consecutive matrices, for interleaving
+      matrices with other data. When `None`, the matrices are stored contiguously.
+
+    Returns:
+    - The byte offset of the matrix following the last matrix written.
+    """
+    if isinstance(matrices, sympy.MatrixBase):
+        matrices = np.array(matrices.evalf().tolist(), dtype=np.float64)
+
+    matrices = np.asarray(matrices)
+    if matrices.shape == (4, 4):
+        matrices = matrices[None]
+
+    if matrices.ndim != 3 or matrices.shape[1:] != (4, 4):
+        raise ValueError(f'Expected a matrix of shape (4, 4) or (N, 4, 4), got {matrices.shape}')
+
+    count = matrices.shape[0]
+    target = packed_view(buffer, count, offset, block_layout, order, dtype, matrix_stride)
+    np.copyto(target, matrices, casting='same_kind')
+
+    return offset + count * target.strides[0]
@@ -2,8 +2,10 @@ import sympy
 
 from dataclasses import dataclass
 
+from .instrumentation import instrumented
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FrustumBounds:
     """
     A data class describing the shape of the viewing frustum for a projection.
@@ -16,7 +18,7 @@ class FrustumBounds:
     far: sympy.Symbol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NDCBounds:
     """
     a data class describing the bounds of the canonical view volume.
@@ -39,7 +41,7 @@ class NDCBounds:
         return f'[{h_min}, {h_max}] x [{v_min}, {v_max}] x [{d_min} {d_max}]'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FrustumFovBounds:
     """
     A data class describing the shape of the viewing frustum for a perspective projection.
@@ -50,6 +52,7 @@ class FrustumFovBounds:
     far: sympy.Symbol
 
 
+@instrumented()
 def perspective(frustum_bounds: FrustumBounds, ndc_bounds: NDCBounds) -> sympy.Matrix:
     """
     Generate an instance of a perspective projection in the canonical orthonormal frames.
@@ -161,6 +164,7 @@ def perspective(frustum_bounds: FrustumBounds, ndc_bounds: NDCBounds) -> sympy.M
     return matrix
 
 
+@instrumented()
 def orthographic(frustum_bounds: FrustumBounds, ndc_bounds: NDCBounds) -> sympy.Matrix:
     """
     Generate an instance of a orthographic projection in the canonical orthonormal frames.
@@ -272,6 +276,7 @@ def orthographic(frustum_bounds: FrustumBounds, ndc_bounds: NDCBounds) -> sympy.
     return matrix
 
 
+@instrumented()
 def perspective_fov(frustum_fov_bounds: FrustumFovBounds, ndc_bounds: NDCBounds) -> sympy.Matrix:
     """
     Generate an instance of a perspective projection in the canonical orthonormal frames.
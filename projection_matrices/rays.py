@@ -0,0 +1,291 @@
+import math
+
+import numpy as np
+
+from collections.abc import Iterator
+
+from .projection_matrices import FrustumBounds
+from .projection_matrices import FrustumFovBounds
+
+
+RAY_PROJECTIONS = ('perspective', 'orthographic')
+
+_BAND_SIZE = 16384
+
+
+def _near_rectangle(bounds: FrustumBounds | FrustumFovBounds, projection: str) -> tuple[float, ...]:
+    # Return the extent of the near plane of the frustum in view space.
+    if projection not in RAY_PROJECTIONS:
+        raise ValueError(f'Expected a projection in {RAY_PROJECTIONS}, got {projection!r}')
+
+    if isinstance(bounds, FrustumFovBounds):
+        if projection != 'perspective':
+            raise ValueError(f'Expected a perspective projection for FrustumFovBounds, got {projection!r}')
+
+        n = float(bounds.near)
+        half_height = n * math.tan(float(bounds.vfov) / 2)
+        half_width = float(bounds.aspect_ratio) * half_height
+
+        return -half_width, half_width, -half_height, half_height, n
+
+    return -float(bounds.left), float(bounds.right), -float(bounds.bottom), float(bounds.top), float(bounds.near)
+
+
+def _output_rays(shape: tuple, dtype, out: tuple[np.ndarray, np.ndarray] | None) -> tuple[np.ndarray, np.ndarray]:
+    if out is None:
+        return np.empty(shape + (3,), dtype=dtype), np.empty(shape + (3,), dtype=dtype)
+
+    origins, directions = out
+    if origins.shape != shape + (3,) or directions.shape != shape + (3,):
+        raise ValueError(f'Expected output arrays of shape {shape + (3,)}, got {origins.shape} and {directions.shape}')
+
+    return origins, directions
+
+
+def _jitter_offsets(jitter, shape: tuple, dtype) -> np.ndarray | None:
+    # Return subpixel offsets in [-0.5, 0.5) broadcastable to `shape + (2,)`.
+    if jitter is None:
+        return None
+    elif isinstance(jitter, np.random.Generator):
+        return jitter.random(shape + (2,), dtype=np.dtype(dtype)) - np.dtype(dtype).type(0.5)
+    else:
+        return np.asarray(jitter, dtype=dtype)
+
+
+def _write_rays(
+    rectangle: tuple[float, ...],
+    projection: str,
+    u: np.ndarray,
+    v: np.ndarray,
+    origins: np.ndarray,
+    directions: np.ndarray,
+    normalize: bool
+) -> None:
+    # Write the rays through the points with normalized image coordinates `(u, v)`,
+    # where `u` increases to the right and `v` increases downwards.
+    x_min, x_max, y_min, y_max, n = rectangle
+    x = x_min + u * (x_max - x_min)
+    y = y_max - v * (y_max - y_min)
+
+    if projection == 'orthographic':
+        origins[..., 0] = x
+        origins[..., 1] = y
+        origins[..., 2] = 0
+        directions[...] = (0, 0, 1)
+        return
+
+    origins[...] = 0
+    if normalize:
+        inverse_norm = 1 / np.sqrt(x * x + y * y + n * n)
+        directions[..., 0] = x * inverse_norm
+        directions[..., 1] = y * inverse_norm
+        directions[..., 2] = n * inverse_norm
+    else:
+        directions[..., 0] = x
+        directions[..., 1] = y
+        directions[..., 2] = n
+
+
+def pixel_rays(
+    bounds: FrustumBounds | FrustumFovBounds,
+    width: int,
+    height: int,
+    pixels: np.ndarray,
+    projection: str = 'perspective',
+    normalize: bool = True,
+    out: tuple[np.ndarray, np.ndarray] | None = None,
+    dtype=np.float32
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generate view space rays through arbitrary pixel coordinates of a viewport.
+
+    The rays are computed directly from the frustum parameters in the canonical view
+    space described in `perspective`. The pixel coordinates `[x, y]` are continuous, with
+    `x` increasing to the right from the left edge of the viewport and `y` increasing
+    downwards from the top edge of the viewport, so the center of the pixel in column `j`
+    and row `i` has the coordinates `[j + 0.5, i + 0.5]`.
+
+    For a perspective projection, every ray starts at the origin of view space and passes
+    through the point of the near plane covered by the pixel. For an orthographic
+    projection, every ray starts at the point of the xy-plane covered by the pixel and
+    points along the positive z-axis.
+
+    Parameters:
+    - bounds: The bounds of the frustum. The fields must be numbers.
+    - width: The width of the viewport in pixels.
+    - height: The height of the viewport in pixels.
+    - pixels: An array of pixel coordinates of shape `S + (2,)`.
+    - projection: The kind of projection, one of `'perspective'` or `'orthographic'`.
+    - normalize: Whether to normalize the directions of perspective rays. When `False`,
+      the direction of each ray is the point of the near plane it passes through.
+    - out: An optional pair of arrays of shape `S + (3,)` to write the origins and
+      directions into.
+    - dtype: The floating point type of the result when `out` is not specified. When
+      `out` is specified, the rays are computed in the type of its arrays.
+
+    Returns:
+    - The origins and the directions of the rays as arrays of shape `S + (3,)`.
+    """
+    rectangle = _near_rectangle(bounds, projection)
+    if out is not None:
+        dtype = out[0].dtype
+    pixels = np.asarray(pixels, dtype=dtype)
+    if pixels.shape[-1:] != (2,):
+        raise ValueError(f'Expected pixel coordinates of shape S + (2,), got {pixels.shape}')
+
+    origins, directions = _output_rays(pixels.shape[:-1], dtype, out)
+    u = pixels[..., 0] * origins.dtype.type(1 / width)
+    v = pixels[..., 1] * origins.dtype.type(1 / height)
+    _write_rays(rectangle, projection, u, v, origins, directions, normalize)
+
+    return origins, directions
+
+
+def _viewport_tile(
+    rectangle: tuple[float, ...],
+    projection: str,
+    width: int,
+    height: int,
+    rows: slice,
+    cols: slice,
+    jitter: np.ndarray | None,
+    origins: np.ndarray,
+    directions: np.ndarray,
+    normalize: bool
+) -> None:
+    dtype = origins.dtype
+    u = (np.arange(cols.start, cols.stop, dtype=dtype) + dtype.type(0.5)) * dtype.type(1 / width)
+    v = (np.arange(rows.start, rows.stop, dtype=dtype) + dtype.type(0.5)) * dtype.type(1 / height)
+    u = u[None, :]
+    v = v[:, None]
+    if jitter is not None:
+        u = u + jitter[..., 0] * dtype.type(1 / width)
+        v = v + jitter[..., 1] * dtype.type(1 / height)
+
+    _write_rays(rectangle, projection, u, v, origins, directions, normalize)
+
+
+def viewport_rays(
+    bounds: FrustumBounds | FrustumFovBounds,
+    width: int,
+    height: int,
+    projection: str = 'perspective',
+    jitter=None,
+    normalize: bool = True,
+    out: tuple[np.ndarray, np.ndarray] | None = None,
+    dtype=np.float32
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generate a view space ray through every pixel of a viewport.
+
+    The ray of the pixel in row `i` and column `j` is stored at index `[i, j]`, and passes
+    through the center of the pixel unless it is jittered. Row `0` is the top row of the
+    viewport. See `pixel_rays` for the definition of the rays.
+
+    Without jitter, the coordinates of the rays are separable in the rows and columns,
+    so they are computed once per row and once per column and broadcast across the
+    viewport. The viewport is processed in bands of rows to keep the intermediate
+    results in cache.
+
+    Parameters:
+    - bounds: The bounds of the frustum. The fields must be numbers.
+    - width: The width of the viewport in pixels.
+    - height: The height of the viewport in pixels.
+    - projection: The kind of projection, one of `'perspective'` or `'orthographic'`.
+    - jitter: Optional subpixel offsets. Either a `numpy.random.Generator`, which draws an
+      independent uniform offset in `[-0.5, 0.5)^2` for every pixel, or an array of
+      offsets in pixels broadcastable to shape `(height, width, 2)`, such as a single
+      offset of a sample pattern shared by all pixels.
+    - normalize: Whether to normalize the directions of perspective rays.
+    - out: An optional pair of arrays of shape `(height, width, 3)` to write the origins
+      and directions into.
+    - dtype: The floating point type of the result when `out` is not specified.
+
+    Returns:
+    - The origins and the directions of the rays as arrays of shape `(height, width, 3)`.
+    """
+    rectangle = _near_rectangle(bounds, projection)
+    origins, directions = _output_rays((height, width), dtype, out)
+    offsets = _jitter_offsets(jitter, (height, width), origins.dtype)
+    if offsets is not None:
+        offsets = np.broadcast_to(offsets, (height, width, 2))
+
+    # Bands of rows keep the temporary arrays in cache.
+    band_height = max(1, _BAND_SIZE // max(width, 1))
+    for row in range(0, height, band_height):
+        rows = slice(row, min(row + band_height, height))
+        _viewport_tile(
+            rectangle, projection, width, height, rows, slice(0, width),
+            None if offsets is None else offsets[rows], origins[rows], directions[rows], normalize
+        )
+
+    return origins, directions
+
+
+def viewport_ray_tiles(
+    bounds: FrustumBounds | FrustumFovBounds,
+    width: int,
+    height: int,
+    tile_size: int | tuple[int, int] = 64,
+    projection: str = 'perspective',
+    jitter=None,
+    normalize: bool = True,
+    dtype=np.float32
+) -> Iterator[tuple[slice, slice, np.ndarray, np.ndarray]]:
+    """
+    Generate the view space rays of a viewport one tile at a time.
+
+    The tiles are generated in row-major order. Each tile is yielded as a tuple
+    `(rows, cols, origins, directions)`, where `rows` and `cols` are the slices of the
+    viewport covered by the tile, and the rays are arrays of shape `(tile_height,
+    tile_width, 3)` with the same contents as `viewport_rays(...)[rows, cols]`. Tiles on
+    the right and bottom edges of the viewport may be smaller than `tile_size`.
+
+    The arrays of the rays are reused between tiles, so a tile is only valid until the
+    next one is requested. Copy the arrays to keep them.
+
+    Parameters:
+    - bounds: The bounds of the frustum. The fields must be numbers.
+    - width: The width of the viewport in pixels.
+    - height: The height of the viewport in pixels.
+    - tile_size: The size of a tile in pixels, either a single number for square tiles,
+      or a pair `(tile_height, tile_width)`.
+    - projection: The kind of projection, one of `'perspective'` or `'orthographic'`.
+    - jitter: Optional subpixel offsets, see `viewport_rays`.
+    - normalize: Whether to normalize the directions of perspective rays.
+    - dtype: The floating point type of the rays.
+
+    Returns:
+    - An iterator over the tiles of the viewport.
+    """
+    rectangle = _near_rectangle(bounds, projection)
+    tile_height, tile_width = (tile_size, tile_size) if isinstance(tile_size, int) else tile_size
+    if tile_height <= 0 or tile_width <= 0:
+        raise ValueError(f'Expected a positive tile size, got {tile_size}')
+
+    dtype = np.dtype(dtype)
+    origins = np.empty((tile_height, tile_width, 3), dtype=dtype)
+    directions = np.empty((tile_height, tile_width, 3), dtype=dtype)
+    if jitter is not None and not isinstance(jitter, np.random.Generator):
+        jitter = np.broadcast_to(np.asarray(jitter, dtype=dtype), (height, width, 2))
+
+    for row in range(0, height, tile_height):
+        rows = slice(row, min(row + tile_height, height))
+        for col in range(0, width, tile_width):
+            cols = slice(col, min(col + tile_width, width))
+            tile_shape = (rows.stop - rows.start, cols.stop - cols.start)
+            tile_origins = origins[:tile_shape[0], :tile_shape[1]]
+            tile_directions = directions[:tile_shape[0], :tile_shape[1]]
+            if isinstance(jitter, np.random.Generator):
+                offsets = _jitter_offsets(jitter, tile_shape, dtype)
+            elif jitter is not None:
+                offsets = jitter[rows, cols]
+            else:
+                offsets = None
+
+            _viewport_tile(
+                rectangle, projection, width, height, rows, cols,
+                offsets, tile_origins, tile_directions, normalize
+            )
+
+            yield rows, cols, tile_origins, tile_directions
@@ -0,0 +1,244 @@
+import numpy as np
+
+from .clipping import clip_planes
+from .numeric import perspective_fov_array
+from .packing import packed_size, packed_view
+from .projection_matrices import FrustumFovBounds
+from .projection_matrices import NDCBounds
+
+
+# The groups of matrix entries that depend on each parameter. Changing the aspect ratio
+# only affects the horizontal scale, changing the vertical field of view affects both
+# scales, and changing the near or far plane only affects the depth mapping.
+_HORIZONTAL = 1
+_VERTICAL = 2
+_DEPTH = 4
+_ENTRIES = _HORIZONTAL | _VERTICAL | _DEPTH
+
+# The derived data kept by a projection state. Each one records which entry groups have
+# changed since it was last brought up to date.
+_MATRIX = 0
+_INVERSE = 3
+_PLANES = 6
+_PACKED = 9
+
+_ALL = sum(_ENTRIES << cache for cache in (_MATRIX, _INVERSE, _PLANES, _PACKED))
+
+_PARAMETERS = {
+    'aspect_ratio': (0, _HORIZONTAL),
+    'vfov': (1, _HORIZONTAL | _VERTICAL),
+    'near': (2, _DEPTH),
+    'far': (3, _DEPTH),
+}
+
+
+class ProjectionState:
+    """
+    A mutable collection of perspective projections with dirty tracking.
+
+    A projection state holds the `FrustumFovBounds` parameters of many viewports in a
+    single array, together with their perspective projection matrices in the canonical
+    orthonormal frames, the inverses of the matrices, the view space planes of their
+    frustums, and a buffer of the matrices packed for upload to a GPU.
+
+    Changing a parameter of a viewport only marks the entries of the matrix that depend
+    on it as out of date. The derived data are brought up to date lazily when they are
+    requested, and only the out of date entries of the changed viewports are recomputed.
+    In particular, resizing a window only changes the aspect ratio, which only changes
+    the entry `[0, 0]` of the matrix, and the entries `[0, 0]` and `[0, 3]` of its
+    inverse, which both depend on it.
+
+    Parameters:
+    - frustum_fov_bounds: The initial bounds of the viewports. The fields are numbers
+      or arrays of numbers, which are broadcast against each other.
+    - ndc_bounds: The bounds of the viewing volume in normalized device coordinates
+      shared by all viewports.
+    - count: The number of viewports. When `None`, it is the size of the fields of
+      `frustum_fov_bounds`.
+    """
+    def __init__(self, frustum_fov_bounds: FrustumFovBounds, ndc_bounds: NDCBounds, count: int | None = None):
+        fields = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64) for value in (
+                frustum_fov_bounds.aspect_ratio, frustum_fov_bounds.vfov,
+                frustum_fov_bounds.near, frustum_fov_bounds.far
+            )
+        ))
+        shape = fields[0].shape if count is None else (count,)
+        self.ndc_bounds = ndc_bounds
+        if len(shape) != 1:
+            raise ValueError(f'Expected one dimensional viewport parameters, got shape {shape}')
+
+        self._parameters = np.empty((4,) + shape, dtype=np.float64)
+        for row, field in enumerate(fields):
+            self._parameters[row] = field
+
+        self._matrices = perspective_fov_array(FrustumFovBounds(*self._parameters), ndc_bounds)
+        self._inverses = np.zeros_like(self._matrices)
+        self._inverses[:, 2, 3] = 1
+        self._planes = np.zeros((self.count, 6, 4), dtype=np.float64)
+        self._clip_planes = clip_planes(ndc_bounds)
+        self._packed = None
+        self._dirty = np.full(self.count, _ALL & ~(_ENTRIES << _MATRIX), dtype=np.uint16)
+
+    @property
+    def count(self) -> int:
+        """
+        The number of viewports.
+        """
+        return self._parameters.shape[1]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> FrustumFovBounds:
+        return FrustumFovBounds(*(float(value) for value in self._parameters[:, index]))
+
+    def update(
+        self,
+        indices=slice(None),
+        aspect_ratio=None,
+        vfov=None,
+        near=None,
+        far=None
+    ) -> None:
+        """
+        Change the parameters of some of the viewports.
+
+        Parameters:
+        - indices: The viewports to change, as an index, a slice, an array of indices, or
+          a boolean mask. By default, all viewports are changed.
+        - aspect_ratio: The new aspect ratios, or `None` to leave them unchanged.
+        - vfov: The new vertical fields of view in radians, or `None` to leave them unchanged.
+        - near: The new near plane distances, or `None` to leave them unchanged.
+        - far: The new far plane distances, or `None` to leave them unchanged.
+        """
+        values = {'aspect_ratio': aspect_ratio, 'vfov': vfov, 'near': near, 'far': far}
+        for name, value in values.items():
+            if value is None:
+                continue
+
+            row, entries = _PARAMETERS[name]
+            self._parameters[row, indices] = value
+            self._dirty[indices] |= sum(entries << cache for cache in (_MATRIX, _INVERSE, _PLANES, _PACKED))
+
+    def matrices(self) -> np.ndarray:
+        """
+        Return the perspective projection matrices of the viewports.
+
+        The result is an internal array of shape `(count, 4, 4)` that is updated in place,
+        and must not be modified.
+        """
+        dirty = self._take_dirty(_MATRIX)
+        if dirty is None:
+            return self._matrices
+
+        indices, entries = dirty
+        h_min = float(self.ndc_bounds.horizontal_min)
+        h_max = float(self.ndc_bounds.horizontal_max)
+        v_min = float(self.ndc_bounds.vertical_min)
+        v_max = float(self.ndc_bounds.vertical_max)
+        d_min = float(self.ndc_bounds.depth_min)
+        d_max = float(self.ndc_bounds.depth_max)
+        aspect_ratio, vfov, n, f = self._parameters
+
+        rows = indices[(entries & (_HORIZONTAL | _VERTICAL)) != 0]
+        cot_half_vfov = 1 / np.tan(vfov[rows] / 2)
+        self._matrices[rows, 0, 0] = ((h_max - h_min) / (2 * aspect_ratio[rows])) * cot_half_vfov
+
+        rows = indices[(entries & _VERTICAL) != 0]
+        self._matrices[rows, 1, 1] = ((v_max - v_min) / 2) / np.tan(vfov[rows] / 2)
+
+        rows = indices[(entries & _DEPTH) != 0]
+        n = n[rows]
+        f = f[rows]
+        self._matrices[rows, 2, 2] = (d_max * f - d_min * n) / (f - n)
+        self._matrices[rows, 2, 3] = -(d_max - d_min) * ((f * n) / (f - n))
+
+        return self._matrices
+
+    def inverses(self) -> np.ndarray:
+        """
+        Return the inverses of the perspective projection matrices of the viewports.
+
+        The result is an internal array of shape `(count, 4, 4)` that is updated in place,
+        and must not be modified.
+        """
+        matrices = self.matrices()
+        dirty = self._take_dirty(_INVERSE)
+        if dirty is None:
+            return self._inverses
+
+        indices, entries = dirty
+        rows = indices[(entries & _HORIZONTAL) != 0]
+        self._inverses[rows, 0, 0] = 1 / matrices[rows, 0, 0]
+        self._inverses[rows, 0, 3] = -matrices[rows, 0, 2] / matrices[rows, 0, 0]
+
+        rows = indices[(entries & _VERTICAL) != 0]
+        self._inverses[rows, 1, 1] = 1 / matrices[rows, 1, 1]
+        self._inverses[rows, 1, 3] = -matrices[rows, 1, 2] / matrices[rows, 1, 1]
+
+        rows = indices[(entries & _DEPTH) != 0]
+        self._inverses[rows, 3, 2] = 1 / matrices[rows, 2, 3]
+        self._inverses[rows, 3, 3] = -matrices[rows, 2, 2] / matrices[rows, 2, 3]
+
+        return self._inverses
+
+    def planes(self) -> np.ndarray:
+        """
+        Return the planes of the frustums of the viewports in view space.
+
+        The planes of each frustum are ordered as left, right, bottom, top, near, far. Each
+        plane `p` satisfies `dot(p, [x, y, z, 1]) >= 0` for the points `[x, y, z]^T` on the
+        inside of the plane. The result is an internal array of shape `(count, 6, 4)` that
+        is updated in place, and must not be modified.
+        """
+        matrices = self.matrices()
+        dirty = self._take_dirty(_PLANES)
+        if dirty is None:
+            return self._planes
+
+        indices, _ = dirty
+        self._planes[indices] = self._clip_planes @ matrices[indices]
+
+        return self._planes
+
+    def packed(self, block_layout: str = 'std140', order: str = 'column_major', dtype=np.float32) -> memoryview:
+        """
+        Return the perspective projection matrices of the viewports packed for upload to
+        a GPU.
+
+        The buffer is repacked from scratch when the layout changes. Otherwise only the
+        matrices of the changed viewports are written into it. See `pack_matrices` for a
+        description of the parameters.
+
+        Returns:
+        - A read-only view of the packed buffer.
+        """
+        matrices = self.matrices()
+        layout = (block_layout, order, np.dtype(dtype))
+        if self._packed is None or self._packed[0] != layout:
+            buffer = bytearray(packed_size(self.count, block_layout, dtype))
+            view = packed_view(buffer, self.count, 0, block_layout, order, dtype)
+            self._packed = (layout, buffer, view)
+            self._take_dirty(_PACKED)
+            view[...] = matrices
+        else:
+            _, buffer, view = self._packed
+            dirty = self._take_dirty(_PACKED)
+            if dirty is not None:
+                indices, _ = dirty
+                view[indices] = matrices[indices]
+
+        return memoryview(buffer).toreadonly()
+
+    def _take_dirty(self, cache: int) -> tuple[np.ndarray, np.ndarray] | None:
+        # Return the viewports and entry groups that changed since the cache was last
+        # brought up to date, and mark the cache as up to date.
+        entries = (self._dirty >> cache) & _ENTRIES
+        indices = np.flatnonzero(entries)
+        if indices.size == 0:
+            return None
+
+        self._dirty[indices] &= ~np.uint16(_ENTRIES << cache)
+
+        return indices, entries[indices]
@@ -0,0 +1,181 @@
+import itertools
+import time
+
+import sympy
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from .conventions import Convention
+from .conventions import CONVENTIONS
+from .derivation import FRUSTUM_FOV_SYMBOLS
+from .derivation import FRUSTUM_SYMBOLS
+from .derivation import PROJECTION_KINDS
+from .projection_matrices import perspective, perspective_fov, orthographic
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    """
+    A data class describing the outcome of verifying one projection kind in one convention.
+
+    * `kind` is the projection kind, one of the entries of `PROJECTION_KINDS`.
+    * `convention` is the name of the convention.
+    * `passed` is whether every check of the case holds.
+    * `failures` describes the checks that do not hold.
+    * `elapsed` is the wall time of the verification in seconds.
+    """
+    kind: str
+    convention: str
+    passed: bool
+    failures: tuple[str, ...]
+    elapsed: float
+
+
+def _frustum_corners(kind: str) -> list:
+    # Return the corners of the frustum of the kind with symbolic parameters, as pairs of
+    # their horizontal, vertical, and depth sides and their coordinates `(x, y, z)` in the
+    # canonical view space.
+    if kind == 'perspective_fov':
+        n = FRUSTUM_FOV_SYMBOLS.near
+        f = FRUSTUM_FOV_SYMBOLS.far
+        half_height = sympy.tan(FRUSTUM_FOV_SYMBOLS.vfov / 2)
+        half_width = FRUSTUM_FOV_SYMBOLS.aspect_ratio * half_height
+        x_extents = {'left': -half_width, 'right': half_width}
+        y_extents = {'bottom': -half_height, 'top': half_height}
+        scale = {'near': n, 'far': f}
+    else:
+        n = FRUSTUM_SYMBOLS.near
+        f = FRUSTUM_SYMBOLS.far
+        if kind == 'perspective':
+            x_extents = {'left': -FRUSTUM_SYMBOLS.left / n, 'right': FRUSTUM_SYMBOLS.right / n}
+            y_extents = {'bottom': -FRUSTUM_SYMBOLS.bottom / n, 'top': FRUSTUM_SYMBOLS.top / n}
+            scale = {'near': n, 'far': f}
+        else:
+            x_extents = {'left': -FRUSTUM_SYMBOLS.left, 'right': FRUSTUM_SYMBOLS.right}
+            y_extents = {'bottom': -FRUSTUM_SYMBOLS.bottom, 'top': FRUSTUM_SYMBOLS.top}
+            scale = {'near': 1, 'far': 1}
+
+    corners = []
+    for (x_side, x), (y_side, y), (z_side, z) in itertools.product(
+        x_extents.items(), y_extents.items(), {'near': n, 'far': f}.items()
+    ):
+        corners.append(((x_side, y_side, z_side), (x * scale[z_side], y * scale[z_side], z)))
+
+    return corners
+
+
+def _canonical_projection(kind: str, convention: Convention) -> sympy.Matrix:
+    if kind == 'perspective':
+        return perspective(FRUSTUM_SYMBOLS, convention.ndc_bounds)
+    elif kind == 'perspective_fov':
+        return perspective_fov(FRUSTUM_FOV_SYMBOLS, convention.ndc_bounds)
+    else:
+        return orthographic(FRUSTUM_SYMBOLS, convention.ndc_bounds)
+
+
+def verify_case(kind: str, name: str, convention: Convention) -> CaseResult:
+    """
+    Verify the projection of one kind in one convention.
+
+    The canonical projection with symbolic parameters is converted into the convention
+    with `Convention.apply`. The result is checked against the definition of the
+    convention, independently of the changes of coordinates used by `Convention`. In the
+    view space of the convention, the viewing direction is the **positive z-axis** for
+    a left-handed convention and the **negative z-axis** for a right-handed one, and the
+    top of the frustum lies along the **positive y-axis**. A convention whose y-direction
+    is down is rotated by half a turn about the **x-axis**, which reverses both of these
+    axes. Every corner of the frustum must map to the corresponding corner of the
+    canonical view volume of the convention, where the left, right, near, and far planes
+    map to the minimum horizontal, maximum horizontal, minimum depth, and maximum depth
+    bounds, and the top plane maps to the maximum vertical bound when the y-direction is
+    up and to the minimum vertical bound when it is down. Each check compares the
+    coordinates with `Matrix.equals`. Since these coordinates do not change when the
+    matrix is scaled, every corner must also have a positive clip space `w` coordinate
+    under the positivity assumptions of the frustum parameters, which rules out a negated
+    matrix that would clip all geometry.
+
+    Parameters:
+    - kind: The projection kind, one of the entries of `PROJECTION_KINDS`.
+    - name: The name of the convention.
+    - convention: The convention.
+
+    Returns:
+    - The outcome of the verification.
+    """
+    if kind not in PROJECTION_KINDS:
+        raise ValueError(f'Expected a projection kind in {PROJECTION_KINDS}, got {kind!r}')
+
+    start = time.perf_counter()
+    matrix = convention.apply(_canonical_projection(kind, convention))
+    ndc_bounds = convention.ndc_bounds
+    y_sign = 1 if convention.y_direction == 'up' else -1
+    z_sign = y_sign if convention.handedness == 'left' else -y_sign
+    expected_sides = {
+        'left': ndc_bounds.horizontal_min,
+        'right': ndc_bounds.horizontal_max,
+        'bottom': ndc_bounds.vertical_min if y_sign > 0 else ndc_bounds.vertical_max,
+        'top': ndc_bounds.vertical_max if y_sign > 0 else ndc_bounds.vertical_min,
+        'near': ndc_bounds.depth_min,
+        'far': ndc_bounds.depth_max,
+    }
+
+    failures = []
+    for sides, (x, y, z) in _frustum_corners(kind):
+        clip = matrix * sympy.Matrix([x, y_sign * y, z_sign * z, 1])
+        if sympy.simplify(clip[3]).is_positive is not True:
+            failures.append(f'{"-".join(sides)} corner has w = {clip[3]}, expected w > 0')
+
+        result = clip[:3, :] / clip[3]
+        expected = sympy.Matrix([expected_sides[side] for side in sides])
+        if not result.equals(expected):
+            failures.append(f'{"-".join(sides)} corner maps to {list(result)}, expected {list(expected)}')
+
+    return CaseResult(kind, name, not failures, tuple(failures), time.perf_counter() - start)
+
+
+def verify_conventions(
+    conventions: dict[str, Convention] = CONVENTIONS,
+    kinds=PROJECTION_KINDS,
+    executor: Executor | None = None
+) -> list[CaseResult]:
+    """
+    Verify every projection kind in every convention.
+
+    A case is generated for each pair of a projection kind and a convention, and verified
+    with `verify_case`. The cases run in parallel in `executor`. When `executor` is `None`,
+    a process pool with one process per core is used for the duration of the call.
+
+    Parameters:
+    - conventions: A dictionary mapping names to conventions, such as the result of
+      `conventions_from_table`.
+    - kinds: The projection kinds to verify.
+    - executor: An optional executor to verify the cases in.
+
+    Returns:
+    - The outcomes of the cases, ordered by convention and then by projection kind.
+    """
+    cases = [(kind, name, convention) for name, convention in conventions.items() for kind in kinds]
+    if executor is None:
+        with ProcessPoolExecutor() as pool:
+            return list(pool.map(verify_case, *zip(*cases)))
+    else:
+        return list(executor.map(verify_case, *zip(*cases)))
+
+
+def format_verification(results: list[CaseResult]) -> str:
+    """
+    Format the outcomes of `verify_conventions` as a plain text report with one line per
+    case, the failed checks, and a summary.
+    """
+    lines = []
+    for result in results:
+        status = 'ok' if result.passed else 'FAILED'
+        lines.append(f'{result.convention:<16} {result.kind:<16} {status:<6} {result.elapsed:8.3f}s')
+        lines.extend(f'    {failure}' for failure in result.failures)
+
+    failed = sum(not result.passed for result in results)
+    total_time = sum(result.elapsed for result in results)
+    lines.append(f'{len(results) - failed} passed, {failed} failed, {total_time:.3f}s total case time')
+
+    return '\n'.join(lines)
@@ -0,0 +1,47 @@
+import numpy as np
+import projection_matrices as pm
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+FRUSTUM_FOV_BOUNDS = pm.FrustumFovBounds(16 / 9, 1, 0.1, 10000)
+
+NDC_BOUNDS = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+
+
+class TestAudit:
+    def test_report_structure(self):
+        with ThreadPoolExecutor(2) as executor:
+            report = pm.audit_round_trip(
+                FRUSTUM_FOV_BOUNDS, NDC_BOUNDS, bands=4, samples_per_band=1000, chunk_size=300, executor=executor
+            )
+
+        assert list(report) == ['float16', 'float32', 'float64']
+        for band_stats in report.values():
+            assert len(band_stats) == 4
+            assert np.isclose(band_stats[0]['z_min'], 0.1)
+            assert np.isclose(band_stats[-1]['z_max'], 10000)
+            assert all(stats['samples'] == 1000 for stats in band_stats)
+
+    def test_error_grows_with_depth_and_precision(self):
+        with ThreadPoolExecutor(2) as executor:
+            report = pm.audit_round_trip(
+                FRUSTUM_FOV_BOUNDS, NDC_BOUNDS, dtypes=(np.float32, np.float64), bands=3,
+                samples_per_band=2000, executor=executor
+            )
+
+        float32 = report['float32']
+        float64 = report['float64']
+        assert float32[0]['median'] < float32[1]['median'] < float32[2]['median']
+        assert all(stats['max'] < 1e-9 for stats in float64)
+        assert all(a['median'] > b['median'] for a, b in zip(float32, float64))
+
+    def test_process_pool_is_reproducible(self):
+        first = pm.audit_round_trip(FRUSTUM_FOV_BOUNDS, NDC_BOUNDS, bands=2, samples_per_band=500, chunk_size=200)
+        with ThreadPoolExecutor(1) as executor:
+            second = pm.audit_round_trip(
+                FRUSTUM_FOV_BOUNDS, NDC_BOUNDS, bands=2, samples_per_band=500, chunk_size=200, executor=executor
+            )
+
+        assert first == second
+        assert 'float16' in pm.format_audit(first)
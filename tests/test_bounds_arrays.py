@@ -0,0 +1,60 @@
+import pickle
+
+import numpy as np
+import pytest
+import projection_matrices as pm
+
+
+class TestBoundsArrays:
+    def test_bounds_are_slotted(self):
+        bounds = pm.FrustumBounds(1, 1, 1, 1, 0.1, 100)
+
+        assert not hasattr(bounds, '__dict__')
+        assert pickle.loads(pickle.dumps(bounds)) == bounds
+        assert hash(bounds) == hash(pm.FrustumBounds(1, 1, 1, 1, 0.1, 100))
+        with pytest.raises(AttributeError):
+            bounds.left = 2
+
+    def test_columns_and_rows(self):
+        bounds = pm.FrustumBoundsArray([1, 2, 3], 1, 1, 1, 0.1, [10, 20, 30])
+
+        assert len(bounds) == 3
+        assert bounds[1] == pm.FrustumBounds(2.0, 1.0, 1.0, 1.0, 0.1, 20.0)
+        assert list(bounds) == [bounds[0], bounds[1], bounds[2]]
+        assert bounds.left.flags.c_contiguous
+        assert np.shares_memory(bounds.far, bounds.data)
+
+    def test_zero_copy_views(self):
+        data = np.array([[4 / 3, 16 / 9, 2], [1, 1.2, 0.8], [0.1, 0.1, 0.5], [100, 1000, 50]])
+        bounds = pm.FrustumFovBoundsArray.from_array(data)
+        tail = bounds[1:]
+        data[0, 2] = 3
+
+        assert np.shares_memory(tail.data, data)
+        assert tail[1].aspect_ratio == 3
+        assert bounds[np.array([0, 2])].vfov.tolist() == [1, 0.8]
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match='indices \\[1\\]'):
+            pm.FrustumBoundsArray(1, 1, 1, 1, [0.1, 10], [100, 5])
+        with pytest.raises(ValueError):
+            pm.FrustumFovBoundsArray(1, [1, 4], 0.1, 100)
+        with pytest.raises(ValueError):
+            pm.NDCBoundsArray(-1, 1, -1, 1, 0, [1, 0])
+
+        bounds = pm.FrustumFovBoundsArray(1, [1, 4], 0.1, 100, validate=False)
+        assert bounds.invalid().tolist() == [False, True]
+
+    def test_feeds_constructors(self):
+        records = [pm.FrustumBounds(1, 2, 1, 1, 0.1, 100), pm.FrustumBounds(0.5, 0.5, 1, 2, 1, 10)]
+        bounds = pm.FrustumBoundsArray.from_records(records)
+        ndc_bounds = pm.NDCBoundsArray(-1, 1, -1, 1, [-1, 0], 1)
+        matrices = pm.perspective_array(bounds, ndc_bounds)
+
+        for i, record in enumerate(records):
+            expected = pm.perspective(record, ndc_bounds[i])
+            assert np.allclose(matrices[i], np.array(expected.tolist(), dtype=np.float64))
+
+        fov_bounds = pm.FrustumFovBoundsArray([1, 2], 1, 0.1, 100)
+        state = pm.ProjectionState(fov_bounds, pm.CONVENTIONS['vulkan_rh'].ndc_bounds)
+        assert np.array_equal(state.matrices(), pm.perspective_fov_array(fov_bounds, state.ndc_bounds))
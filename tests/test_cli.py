@@ -0,0 +1,124 @@
+import json
+
+import numpy as np
+import projection_matrices as pm
+
+from projection_matrices.cli import main
+
+
+class TestCommandLine:
+    def test_csv_to_jsonl(self, tmp_path):
+        input_path = tmp_path / 'cameras.csv'
+        input_path.write_text('aspect_ratio,vfov,near,far\n1.5,1.0,0.1,100\n2.0,0.5,1,10\n1.0,1.0,1,2\n')
+        output_path = tmp_path / 'matrices.jsonl'
+        status = main([
+            'perspective_fov', '--convention', 'vulkan_rh', '--chunk-size', '2', '--order', 'row',
+            '--input', str(input_path), '--output', str(output_path)
+        ])
+        result = np.array([json.loads(line) for line in output_path.read_text().splitlines()])
+        convention = pm.CONVENTIONS['vulkan_rh']
+        frustum_fov_bounds = pm.FrustumFovBounds([1.5, 2.0, 1.0], [1.0, 0.5, 1.0], [0.1, 1, 1], [100, 10, 2])
+        expected = pm.apply_convention_array(
+            convention, pm.perspective_fov_array(frustum_fov_bounds, convention.ndc_bounds)
+        )
+
+        assert status == 0
+        assert np.allclose(result, expected)
+
+    def test_jsonl_order(self, tmp_path):
+        input_path = tmp_path / 'cameras.csv'
+        input_path.write_text('left,right,bottom,top,near,far\n1,2,1,1,1,10\n')
+        results = {}
+        for order in ('row', 'column'):
+            output_path = tmp_path / f'{order}.jsonl'
+            status = main([
+                'perspective', '--convention', 'opengl_rh', '--order', order,
+                '--input', str(input_path), '--output', str(output_path)
+            ])
+            assert status == 0
+            results[order] = np.array(json.loads(output_path.read_text()))
+
+        assert not np.allclose(results['row'], results['column'])
+        assert np.array_equal(results['row'], results['column'].T)
+
+    def test_jsonl_to_float32_column_major(self, tmp_path):
+        input_path = tmp_path / 'cameras.jsonl'
+        records = [
+            {'left': 1, 'right': 2, 'bottom': 1, 'top': 1, 'near': 1, 'far': 10},
+            {'left': 3, 'right': 3, 'bottom': 2, 'top': 1, 'near': 2, 'far': 20},
+        ]
+        input_path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+        output_path = tmp_path / 'matrices.bin'
+        status = main([
+            'orthographic', '--ndc-bounds', '-1', '1', '-1', '1', '0', '1', '--output-format', 'f32',
+            '--input', str(input_path), '--output', str(output_path)
+        ])
+        result = np.frombuffer(output_path.read_bytes(), dtype='<f4').reshape(-1, 4, 4).transpose(0, 2, 1)
+        frustum_bounds = pm.FrustumBounds(*([record[name] for record in records] for name in records[0]))
+        expected = pm.orthographic_array(frustum_bounds, pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+
+        assert status == 0
+        assert np.allclose(result, expected)
+
+    def test_c_header(self, tmp_path):
+        input_path = tmp_path / 'cameras.csv'
+        input_path.write_text('left,right,bottom,top,near,far\n1,1,1,1,1,10\n')
+        output_path = tmp_path / 'matrices.h'
+        status = main([
+            'perspective', '--convention', 'opengl_rh', '--output-format', 'c-header',
+            '--input', str(input_path), '--output', str(output_path)
+        ])
+        result = output_path.read_text()
+
+        assert status == 0
+        assert 'static const float projection_matrices[][16] = {' in result
+        assert '#define PROJECTION_MATRICES_COUNT 1' in result
+
+    def test_invalid_record(self, tmp_path, capsys):
+        input_path = tmp_path / 'cameras.csv'
+        input_path.write_text('aspect_ratio,vfov,near\n1.5,1.0,0.1\n')
+        status = main([
+            'perspective_fov', '--convention', 'opengl_lh',
+            '--input', str(input_path), '--output', str(tmp_path / 'matrices.jsonl')
+        ])
+
+        assert status == 1
+        assert 'far' in capsys.readouterr().err
+
+    def test_unreadable_input_and_unwritable_output(self, tmp_path, capsys):
+        input_path = tmp_path / 'cameras.csv'
+        input_path.write_text('left,right,bottom,top,near,far\n1,1,1,1,1,10\n')
+        missing_input = main(['perspective', '--convention', 'opengl_rh', '--input', str(tmp_path / 'missing.csv')])
+        assert missing_input == 1
+        assert 'missing.csv' in capsys.readouterr().err
+
+        unwritable_output = main([
+            'perspective', '--convention', 'opengl_rh',
+            '--input', str(input_path), '--output', str(tmp_path / 'missing' / 'matrices.jsonl')
+        ])
+        assert unwritable_output == 1
+        assert capsys.readouterr().err.startswith('error: ')
+
+    def test_degenerate_record(self, tmp_path, capsys):
+        input_path = tmp_path / 'cameras.csv'
+        input_path.write_text('left,right,bottom,top,near,far\n1,1,1,1,1,10\n1,1,1,1,0,0\n')
+        output_path = tmp_path / 'matrices.h'
+        status = main([
+            'perspective', '--convention', 'opengl_rh', '--output-format', 'c-header',
+            '--input', str(input_path), '--output', str(output_path)
+        ])
+
+        assert status == 1
+        assert 'Invalid FrustumBounds record 2' in capsys.readouterr().err
+        assert 'nan' not in output_path.read_text()
+
+    def test_malformed_json_record(self, tmp_path, capsys):
+        input_path = tmp_path / 'cameras.jsonl'
+        input_path.write_text('{"aspect_ratio": 1, "vfov": 1, "near": 1, "far": 10}\n\n{"aspect_ratio": 1,\n')
+        status = main([
+            'perspective_fov', '--convention', 'opengl_rh',
+            '--input', str(input_path), '--output', str(tmp_path / 'matrices.jsonl')
+        ])
+
+        assert status == 1
+        assert 'Invalid FrustumFovBounds record 2' in capsys.readouterr().err
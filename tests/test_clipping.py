@@ -0,0 +1,60 @@
+import numpy as np
+import projection_matrices as pm
+
+
+def homogeneous(points: list, w: float = 1) -> np.ndarray:
+    return np.array([[x * w, y * w, z * w, w] for x, y, z in points], dtype=np.float64)
+
+
+class TestClipping:
+    def test_triangle_inside_is_unchanged(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        triangle = homogeneous([(-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0, 0.5, 0.5)], w=2)
+        vertices, offsets = pm.clip_polygons(triangle[None], ndc_bounds)
+
+        assert offsets.tolist() == [0, 3]
+        assert np.array_equal(vertices, triangle)
+
+    def test_triangle_outside_is_discarded(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        triangle = homogeneous([(2, -0.5, 0.5), (3, -0.5, 0.5), (2.5, 0.5, 0.5)])
+        vertices, offsets = pm.clip_polygons(triangle[None], ndc_bounds)
+
+        assert offsets.tolist() == [0, 0]
+        assert vertices.shape == (0, 4)
+
+    def test_triangle_crossing_one_plane(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        triangle = homogeneous([(0, 0, 0), (2, 0, 0), (0, 0.5, 0)])
+        vertices, offsets = pm.clip_polygons(triangle[None], ndc_bounds)
+        expected = homogeneous([(0, 0, 0), (1, 0, 0), (1, 0.25, 0), (0, 0.5, 0)])
+
+        assert offsets.tolist() == [0, 4]
+        assert np.allclose(vertices, expected)
+
+    def test_depth_range(self):
+        triangle = homogeneous([(0, 0, -0.5), (0.5, 0, -0.5), (0, 0.5, -0.5)])
+        _, offsets_opengl = pm.clip_polygons(triangle[None], pm.NDCBounds(-1, 1, -1, 1, -1, 1))
+        _, offsets_vulkan = pm.clip_polygons(triangle[None], pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+
+        assert offsets_opengl.tolist() == [0, 3]
+        assert offsets_vulkan.tolist() == [0, 0]
+
+    def test_clipped_batch_lies_in_view_volume(self):
+        rng = np.random.default_rng(0)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        triangles = rng.uniform(-2, 2, (1000, 3, 4))
+        triangles[..., 3] = rng.uniform(0.5, 2, (1000, 3))
+        vertices, offsets = pm.clip_polygons(triangles, ndc_bounds)
+        clipped, triangle_offsets = pm.clip_triangles(triangles, ndc_bounds)
+        planes = pm.clip_planes(ndc_bounds)
+
+        assert np.all(vertices @ planes.T >= -1e-12)
+        assert np.array_equal(np.diff(triangle_offsets), np.maximum(np.diff(offsets) - 2, 0))
+        assert clipped.shape == (triangle_offsets[-1], 3, 4)
+        for i in np.flatnonzero(np.diff(triangle_offsets)):
+            polygon = vertices[offsets[i]:offsets[i + 1]]
+            fan = clipped[triangle_offsets[i]:triangle_offsets[i + 1]]
+            assert np.array_equal(fan[:, 0], np.broadcast_to(polygon[0], fan[:, 0].shape))
+            assert np.array_equal(fan[:, 1], polygon[1:-1])
+            assert np.array_equal(fan[:, 2], polygon[2:])
@@ -0,0 +1,87 @@
+import asyncio
+
+import numpy as np
+import projection_matrices as pm
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TestCoalescingEvaluator:
+    def test_requests_are_coalesced(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        frustums = [pm.FrustumFovBounds(1 + i / 10, 1.0, 0.1, 100) for i in range(10)]
+
+        async def run():
+            evaluator = pm.CoalescingEvaluator(max_latency=0.01)
+            results = await asyncio.gather(*(evaluator.perspective_fov(frustum, ndc_bounds) for frustum in frustums))
+            return results, evaluator.metrics()
+
+        results, metrics = asyncio.run(run())
+
+        assert metrics['batches'] == 1
+        assert metrics['requests'] == 10
+        assert metrics['queue_depth'] == 0
+        for frustum, result in zip(frustums, results):
+            assert np.allclose(result, pm.perspective_fov_array(frustum, ndc_bounds))
+
+    def test_max_batch_size_triggers_evaluation(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        frustums = [pm.FrustumBounds(1, 1, 1, 1, 1, 10 + i) for i in range(10)]
+
+        async def run():
+            evaluator = pm.CoalescingEvaluator(max_latency=10, max_batch_size=4)
+            async with evaluator:
+                tasks = [asyncio.ensure_future(evaluator.orthographic(frustum, ndc_bounds)) for frustum in frustums]
+                await asyncio.sleep(0)
+                queue_depth = evaluator.metrics()['queue_depth']
+            return await asyncio.gather(*tasks), queue_depth, evaluator.metrics()
+
+        results, queue_depth, metrics = asyncio.run(run())
+
+        assert queue_depth == 2
+        assert metrics['batches'] == 3
+        assert metrics['max_batch_size'] == 4
+        for frustum, result in zip(frustums, results):
+            assert np.allclose(result, pm.orthographic_array(frustum, ndc_bounds))
+
+    def test_mixed_requests_in_executor(self):
+        opengl = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        vulkan = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        frustum_bounds = pm.FrustumBounds(1, 2, 1, 1, 1, 10)
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                evaluator = pm.CoalescingEvaluator(executor=executor)
+                results = await asyncio.gather(
+                    evaluator.perspective(frustum_bounds, opengl),
+                    evaluator.perspective(frustum_bounds, vulkan),
+                    evaluator.orthographic(frustum_bounds, vulkan),
+                )
+            return results, evaluator.metrics()
+
+        results, metrics = asyncio.run(run())
+
+        assert metrics['batches'] == 1
+        assert metrics['evaluations'] == 3
+        assert np.allclose(results[0], pm.perspective_array(frustum_bounds, opengl))
+        assert np.allclose(results[1], pm.perspective_array(frustum_bounds, vulkan))
+        assert np.allclose(results[2], pm.orthographic_array(frustum_bounds, vulkan))
+
+    def test_malformed_request_fails_alone(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        frustum_bounds = pm.FrustumBounds(1, 1, 1, 1, 1, 10)
+
+        async def run():
+            evaluator = pm.CoalescingEvaluator(max_latency=0.01)
+            results = await asyncio.gather(
+                evaluator.perspective(frustum_bounds, ndc_bounds),
+                evaluator.perspective(pm.FrustumBounds('x', 1, 1, 1, 1, 10), ndc_bounds),
+                return_exceptions=True
+            )
+            return results, evaluator.metrics()
+
+        results, metrics = asyncio.run(run())
+
+        assert np.allclose(results[0], pm.perspective_array(frustum_bounds, ndc_bounds))
+        assert isinstance(results[1], ValueError)
+        assert metrics['requests'] == 1
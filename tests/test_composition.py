@@ -0,0 +1,49 @@
+import numpy as np
+import projection_matrices as pm
+import pytest
+import sympy
+
+
+def random_affine_matrices(rng: np.random.Generator, count: int) -> np.ndarray:
+    matrices = np.zeros((count, 4, 4), dtype=np.float64)
+    matrices[:, :3, :] = rng.standard_normal((count, 3, 4))
+    matrices[:, 3, 3] = 1
+
+    return matrices
+
+
+class TestModelViewProjection:
+    def test_projection_view_symbolic_projection(self):
+        rng = np.random.default_rng(0)
+        projection = pm.perspective(pm.FrustumBounds(1, 2, 1, 1, 1, 10), pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+        view = random_affine_matrices(rng, 1)[0]
+        expected = np.array(projection.tolist(), dtype=np.float64) @ view
+
+        assert np.allclose(pm.projection_view(projection, view), expected)
+
+    def test_model_view_projection_row_major(self):
+        rng = np.random.default_rng(1)
+        projection = pm.orthographic_array(pm.FrustumBounds(1, 2, 1, 1, 1, 10), pm.NDCBounds(-1, 1, -1, 1, -1, 1))
+        view = random_affine_matrices(rng, 1)[0]
+        models = random_affine_matrices(rng, 16)
+        out = np.empty_like(models)
+        result = pm.model_view_projection(projection, view, models, out=out)
+
+        assert result is out
+        assert np.allclose(result, projection @ view @ models)
+
+    def test_model_view_projection_column_major_float32(self):
+        rng = np.random.default_rng(2)
+        frustum_fov_bounds = pm.FrustumFovBounds(sympy.Rational(16, 9), sympy.pi / 3, 1, 100)
+        projection = pm.perspective_fov(frustum_fov_bounds, pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+        view = random_affine_matrices(rng, 1)[0]
+        models = random_affine_matrices(rng, 8)
+        out = np.empty((8, 4, 4), dtype=np.float32)
+        pm.model_view_projection(projection, view, models, out=out, layout='column_major')
+        expected = np.array(projection.evalf().tolist(), dtype=np.float64) @ view @ models
+
+        assert np.allclose(out.transpose(0, 2, 1), expected, rtol=1e-5, atol=1e-5)
+
+    def test_model_view_projection_invalid_shape(self):
+        with pytest.raises(ValueError):
+            pm.model_view_projection(np.eye(4), np.eye(4), np.zeros((4, 4)))
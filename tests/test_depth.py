@@ -0,0 +1,64 @@
+import numpy as np
+import projection_matrices as pm
+
+
+def project_depth(matrix: np.ndarray, z: np.ndarray) -> np.ndarray:
+    return (matrix[2, 2] * z + matrix[2, 3]) / (matrix[3, 2] * z + matrix[3, 3])
+
+
+class TestDepth:
+    def test_linearize_perspective(self):
+        frustum_bounds = pm.FrustumBounds(1, 1, 1, 1, 0.1, 1000)
+        z = np.geomspace(0.1, 1000, 100)
+        for ndc_bounds in (pm.NDCBounds(-1, 1, -1, 1, -1, 1), pm.NDCBounds(-1, 1, -1, 1, 0, 1)):
+            matrix = pm.perspective_array(frustum_bounds, ndc_bounds)
+            result = pm.linearize_depth(project_depth(matrix, z), frustum_bounds, ndc_bounds)
+
+            assert np.allclose(result, z)
+
+    def test_linearize_orthographic_and_reversed(self):
+        frustum_bounds = pm.FrustumBounds(1, 1, 1, 1, 1, 11)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        depth = np.array([1, 0.5, 0])
+        result = pm.linearize_depth(depth, frustum_bounds, ndc_bounds, pm.REVERSED_Z, projection='orthographic')
+
+        assert np.allclose(result, [1, 6, 11])
+
+    def test_linearize_infinite_far(self):
+        frustum_fov_bounds = pm.FrustumFovBounds(1, 1, 0.5, float('inf'))
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        z = np.array([0.5, 1, 100])
+        depth = 0.5 / z
+        result = pm.linearize_depth(depth, frustum_fov_bounds, ndc_bounds, pm.REVERSED_Z_INFINITE_FAR)
+
+        assert np.allclose(result, z)
+
+    def test_convert_depth(self):
+        frustum_bounds = pm.FrustumBounds(1, 1, 1, 1, 0.1, 100)
+        opengl = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        vulkan = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        z = np.linspace(0.1, 100, 50)
+        depth_opengl = project_depth(pm.perspective_array(frustum_bounds, opengl), z)
+        depth_vulkan = project_depth(pm.perspective_array(frustum_bounds, vulkan), z)
+        reversed_matrix = np.array(pm.instantiate_projection('perspective', frustum_bounds, vulkan, pm.REVERSED_Z))
+        depth_reversed = project_depth(reversed_matrix.astype(np.float64), z)
+
+        assert np.allclose(pm.convert_depth(depth_opengl, opengl, vulkan), depth_vulkan)
+        assert np.allclose(pm.convert_depth(depth_vulkan, vulkan, opengl), depth_opengl)
+        assert np.allclose(pm.convert_depth(depth_vulkan, vulkan, vulkan, to_constraints=pm.REVERSED_Z), depth_reversed)
+
+    def test_memmap_in_place(self, tmp_path):
+        frustum_fov_bounds = pm.FrustumFovBounds(16 / 9, 1, 0.1, 100)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        z = np.random.default_rng(0).uniform(0.1, 100, (300, 400)).astype(np.float32)
+        matrix = pm.perspective_fov_array(frustum_fov_bounds, ndc_bounds)
+        capture = np.memmap(tmp_path / 'depth.bin', dtype=np.float32, mode='w+', shape=z.shape)
+        capture[...] = project_depth(matrix, z)
+        expected = pm.linearize_depth(np.array(capture), frustum_fov_bounds, ndc_bounds)
+        result = pm.linearize_depth(capture, frustum_fov_bounds, ndc_bounds, out=capture, chunk_size=1000)
+        capture.flush()
+
+        assert result is capture
+        assert expected.dtype == np.float32
+        assert np.array_equal(np.fromfile(tmp_path / 'depth.bin', dtype=np.float32).reshape(z.shape), expected)
+        assert np.allclose(expected, z, rtol=1e-3)
@@ -0,0 +1,83 @@
+import projection_matrices as pm
+import pytest
+import sympy
+
+
+def project(matrix: sympy.Matrix, point: list) -> sympy.Matrix:
+    clip = matrix * sympy.Matrix(point + [1])
+
+    return (clip[:3, :] / clip[3]).applyfunc(sympy.simplify)
+
+
+class TestDerivation:
+    def test_standard_perspective(self):
+        l, r, b, t, n, f = sympy.symbols('l r b t n f')
+        frustum_bounds = pm.FrustumBounds(l, r, b, t, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        expected = pm.perspective(frustum_bounds, ndc_bounds)
+        result = pm.instantiate_projection('perspective', frustum_bounds, ndc_bounds)
+
+        assert result.equals(expected)
+
+    def test_standard_perspective_fov(self):
+        aspect, theta_vfov, n, f = sympy.symbols('aspect theta_vfov n f')
+        frustum_bounds = pm.FrustumFovBounds(aspect, theta_vfov, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        expected = pm.perspective_fov(frustum_bounds, ndc_bounds)
+        result = pm.instantiate_projection('perspective_fov', frustum_bounds, ndc_bounds)
+
+        assert result.equals(expected)
+
+    def test_standard_orthographic(self):
+        l, r, b, t, n, f = sympy.symbols('l r b t n f')
+        frustum_bounds = pm.FrustumBounds(l, r, b, t, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        expected = pm.orthographic(frustum_bounds, ndc_bounds)
+        result = pm.instantiate_projection('orthographic', frustum_bounds, ndc_bounds)
+
+        assert result.equals(expected)
+
+    def test_reversed_z_perspective(self):
+        l, r, b, t, n, f = sympy.symbols('l r b t n f', positive=True)
+        frustum_bounds = pm.FrustumBounds(l, r, b, t, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        result = pm.instantiate_projection('perspective', frustum_bounds, ndc_bounds, pm.REVERSED_Z)
+
+        assert project(result, [0, 0, n])[2] == 1
+        assert project(result, [0, 0, f])[2] == 0
+        assert project(result, [-l, -b, n])[:2, :] == sympy.Matrix([-1, -1])
+        assert project(result, [r * f / n, t * f / n, f])[:2, :] == sympy.Matrix([1, 1])
+
+    def test_reversed_z_infinite_far_perspective_fov(self):
+        aspect, theta_vfov, n, f = sympy.symbols('aspect theta_vfov n f', positive=True)
+        frustum_bounds = pm.FrustumFovBounds(aspect, theta_vfov, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        expected = sympy.Matrix([
+            [1 / (aspect * sympy.tan(theta_vfov / 2)), 0,                              0, 0],
+            [0,                                        1 / sympy.tan(theta_vfov / 2), 0, 0],
+            [0,                                        0,                              0, n],
+            [0,                                        0,                              1, 0]
+        ])
+        result = pm.instantiate_projection('perspective_fov', frustum_bounds, ndc_bounds, pm.REVERSED_Z_INFINITE_FAR)
+
+        assert result.equals(expected)
+
+    def test_closed_form_is_cached(self):
+        constraints = pm.ProjectionConstraints(near='depth_max', far='depth_min')
+
+        assert pm.derive_projection('orthographic', constraints) is pm.derive_projection('orthographic', pm.REVERSED_Z)
+
+    def test_cache_can_be_inspected_and_cleared(self):
+        cached = pm.derive_projection('perspective')
+        assert pm.derive_projection.cache_info().currsize > 0
+
+        pm.derive_projection.cache_clear()
+        assert pm.derive_projection.cache_info().currsize == 0
+
+        result = pm.derive_projection('perspective')
+        assert result is not cached
+        assert result == cached
+
+    def test_orthographic_infinite_far(self):
+        with pytest.raises(ValueError):
+            pm.derive_projection('orthographic', pm.INFINITE_FAR)
@@ -0,0 +1,92 @@
+import projection_matrices as pm
+import sympy
+
+from sympy.polys.domains import QQ
+
+
+def change_of_orientation_lh_to_rh() -> sympy.Matrix:
+    return sympy.Matrix([
+        [1, 0,  0, 0],
+        [0, 1,  0, 0],
+        [0, 0, -1, 0],
+        [0, 0,  0, 1]
+    ])
+
+
+def rotation_x(angle: sympy.Symbol) -> sympy.Matrix:
+    return sympy.Matrix([
+        [1, 0,                 0,                0],
+        [0, sympy.cos(angle), -sympy.sin(angle), 0],
+        [0, sympy.sin(angle),  sympy.cos(angle), 0],
+        [0, 0,                 0,                1]
+    ])
+
+
+class TestDomainMatrices:
+    def test_perspective_domain_round_trip(self):
+        l, r, b, t, n, f = sympy.symbols('l r b t n f')
+        frustum_bounds = pm.FrustumBounds(l, r, b, t, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        expected = pm.perspective(frustum_bounds, ndc_bounds)
+        result = pm.perspective_domain(frustum_bounds, ndc_bounds)
+
+        assert result.domain == QQ.frac_field(*result.domain.symbols)
+        assert (result.to_Matrix() - expected).applyfunc(sympy.simplify) == sympy.zeros(4, 4)
+
+    def test_perspective_fov_domain_round_trip(self):
+        aspect, theta_vfov, n, f = sympy.symbols('aspect theta_vfov n f')
+        frustum_bounds = pm.FrustumFovBounds(aspect, theta_vfov, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        expected = pm.perspective_fov(frustum_bounds, ndc_bounds)
+        result = pm.perspective_fov_domain(frustum_bounds, ndc_bounds)
+
+        assert sympy.tan(theta_vfov / 2) in result.domain.symbols
+        assert (result.to_Matrix() - expected).applyfunc(sympy.simplify) == sympy.zeros(4, 4)
+
+    def test_orthographic_domain_inverse(self):
+        l, r, b, t, n, f = sympy.symbols('l r b t n f')
+        frustum_bounds = pm.FrustumBounds(l, r, b, t, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        m = pm.orthographic_domain(frustum_bounds, ndc_bounds)
+        identity = m.eye(4, m.domain).to_dense()
+
+        assert m * m.inv() == identity
+        assert m.inv() * m == identity
+
+    def test_perspective_domain_composition(self):
+        l, r, b, t, n, f = sympy.symbols('l r b t n f')
+        frustum_bounds = pm.FrustumBounds(l, r, b, t, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        expected = sympy.Matrix([
+            [(2 * n) / (r - (-l)), 0,                     (r + (-l)) / (r - (-l)),  0                ],
+            [0,                    (2 * n) / (t - (-b)),  (b + (-t)) / (b - (-t)),  0                ],
+            [0,                    0,                    -f / (f - n),             -(f * n) / (f - n)],
+            [0,                    0,                    -1,                        0                ]
+        ])
+        m_canonical_lh_lh = pm.perspective_domain(frustum_bounds, ndc_bounds)
+        domain = m_canonical_lh_lh.domain
+        x_lh_rh = pm.to_domain_matrix(change_of_orientation_lh_to_rh(), domain)
+        m_coord = pm.to_domain_matrix(rotation_x(sympy.pi), domain)
+        m_coord_inv = m_coord.inv()
+        result = (x_lh_rh * m_coord_inv) * m_canonical_lh_lh * m_coord
+
+        assert result == pm.to_domain_matrix(expected, domain)
+
+    def test_algebraic_field_of_view(self):
+        aspect, n, f = sympy.symbols('aspect n f')
+        frustum_bounds = pm.FrustumFovBounds(aspect, sympy.pi / 3, n, f)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        expected = pm.perspective_fov(frustum_bounds, ndc_bounds)
+        result = pm.perspective_fov_domain(frustum_bounds, ndc_bounds)
+
+        assert (result.to_Matrix() - expected).applyfunc(sympy.simplify) == sympy.zeros(4, 4)
+
+    def test_float_entries_are_exact(self):
+        frustum_bounds = pm.FrustumBounds(1, 1, 1, 1, 0.1, 100)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        expected = pm.perspective(frustum_bounds, ndc_bounds)
+        result = pm.perspective_domain(frustum_bounds, ndc_bounds)
+
+        assert result.domain == QQ
+        assert result.to_Matrix() == expected.applyfunc(sympy.Rational)
+        assert result.to_Matrix().applyfunc(float) == expected.applyfunc(float)
@@ -0,0 +1,40 @@
+import json
+
+import projection_matrices as pm
+import sympy
+
+
+class TestInstrumentation:
+    def test_profiling_records_entry_points(self):
+        l, r, b, t, n, f = sympy.symbols('l r b t n f')
+        frustum_bounds = pm.FrustumBounds(l, r, b, t, n, f)
+        convention = pm.CONVENTIONS['vulkan_rh']
+        with pm.profiling() as stats:
+            matrix = pm.perspective(frustum_bounds, convention.ndc_bounds)
+            pm.orthographic(frustum_bounds, convention.ndc_bounds)
+            pm.orthographic(frustum_bounds, convention.ndc_bounds)
+            result = convention.apply(matrix)
+            with pm.timed('simplify'):
+                sympy.simplify(result)
+
+        assert stats['perspective']['calls'] == 1
+        assert stats['perspective']['total_ops'] == sum(sympy.count_ops(entry) for entry in matrix)
+        assert stats['orthographic']['calls'] == 2
+        assert stats['Convention.apply']['calls'] == 1
+        assert stats['simplify']['calls'] == 1
+        assert stats['simplify']['total_time'] > 0
+
+    def test_profiling_disabled_by_default(self):
+        pm.reset_profile()
+        pm.perspective_fov(pm.FrustumFovBounds(1, 1, 1, 10), pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+
+        assert pm.profile_stats() == {}
+
+    def test_trace_file(self, tmp_path):
+        path = tmp_path / 'trace.json'
+        with pm.profiling(trace_file=str(path)):
+            pm.perspective_fov(pm.FrustumFovBounds(1, 1, 1, 10), pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+        events = json.loads(path.read_text())['traceEvents']
+
+        assert [event['name'] for event in events] == ['perspective_fov']
+        assert events[0]['ph'] == 'X'
@@ -0,0 +1,52 @@
+import numpy as np
+import projection_matrices as pm
+import sympy
+
+
+class TestNumericArrays:
+    def test_perspective_array_matches_symbolic(self):
+        frustum_bounds = pm.FrustumBounds([1, 2], [1, 3], [1, 0.5], [1, 1.5], [0.1, 1], [100, 10])
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        result = pm.perspective_array(frustum_bounds, ndc_bounds)
+
+        assert result.shape == (2, 4, 4)
+        for i in range(2):
+            expected = pm.perspective(pm.FrustumBounds(
+                *(sympy.nsimplify(field[i]) for field in (
+                    frustum_bounds.left, frustum_bounds.right, frustum_bounds.bottom,
+                    frustum_bounds.top, frustum_bounds.near, frustum_bounds.far
+                ))
+            ), ndc_bounds)
+            assert np.allclose(result[i], np.array(expected.tolist(), dtype=np.float64))
+
+    def test_perspective_fov_array_matches_symbolic(self):
+        frustum_fov_bounds = pm.FrustumFovBounds(np.array([1.5, 2.0]), np.array([1.0, 0.5]), 0.1, 100)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        result = pm.perspective_fov_array(frustum_fov_bounds, ndc_bounds)
+
+        for i in range(2):
+            expected = pm.perspective_fov(pm.FrustumFovBounds(
+                sympy.Float(frustum_fov_bounds.aspect_ratio[i]), sympy.Float(frustum_fov_bounds.vfov[i]),
+                sympy.Float(0.1), sympy.Float(100)
+            ), ndc_bounds)
+            assert np.allclose(result[i], np.array(expected.evalf().tolist(), dtype=np.float64))
+
+    def test_orthographic_array_out_parameter(self):
+        frustum_bounds = pm.FrustumBounds(1, 2, 1, 1, 1, 10)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        out = np.full((4, 4), np.nan, dtype=np.float32)
+        result = pm.orthographic_array(frustum_bounds, ndc_bounds, out=out)
+        expected = pm.orthographic(pm.FrustumBounds(1, 2, 1, 1, 1, 10), ndc_bounds)
+
+        assert result is out
+        assert np.allclose(result, np.array(expected.tolist(), dtype=np.float64))
+
+    def test_apply_convention_array(self):
+        frustum_fov_bounds = pm.FrustumFovBounds(sympy.Rational(3, 2), 1, 1, 10)
+        for name, convention in pm.CONVENTIONS.items():
+            canonical = pm.perspective_fov(frustum_fov_bounds, convention.ndc_bounds)
+            expected = np.array(convention.apply(canonical).evalf().tolist(), dtype=np.float64)
+            matrices = pm.perspective_fov_array(pm.FrustumFovBounds(1.5, 1.0, 1.0, 10.0), convention.ndc_bounds)
+            result = pm.apply_convention_array(convention, matrices)
+
+            assert np.allclose(result, expected), name
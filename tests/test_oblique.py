@@ -0,0 +1,75 @@
+import numpy as np
+import sympy
+import projection_matrices as pm
+
+
+FRUSTUM_BOUNDS = pm.FrustumBounds(*sympy.sympify([1, 1, 1, 1, 1, 100]))
+
+
+def ndc_depth(matrix: np.ndarray, point: list) -> float:
+    clip = matrix @ np.array(point + [1], dtype=np.float64)
+    return clip[2] / clip[3]
+
+
+class TestObliqueProjection:
+    def test_matches_lengyel_opengl(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        matrix = pm.perspective(FRUSTUM_BOUNDS, ndc_bounds)
+        plane = sympy.Matrix([0, 1, 1, -5])
+        result = pm.oblique_projection(matrix, ndc_bounds, plane)
+        corner = matrix.inv() * sympy.Matrix([1, 1, 1, 1])
+        expected = (2 * (matrix[3, :] * corner)[0] / (plane.T * corner)[0]) * plane.T - matrix[3, :]
+
+        assert result[[0, 1, 3], :] == matrix[[0, 1, 3], :]
+        assert (result[2, :] - expected).applyfunc(sympy.simplify) == sympy.zeros(1, 4)
+
+    def test_clip_plane_maps_to_depth_min(self):
+        for d_min in (-1, 0):
+            ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, d_min, 1)
+            matrix = pm.perspective(FRUSTUM_BOUNDS, ndc_bounds)
+            result = np.array(pm.oblique_projection(matrix, ndc_bounds, [1, 0, 2, -10]).tolist(), dtype=np.float64)
+
+            assert np.isclose(ndc_depth(result, [0, 0, 5]), d_min)
+            assert np.isclose(ndc_depth(result, [2, 3, 4]), d_min)
+            assert ndc_depth(result, [0, 0, 20]) > d_min
+
+    def test_symbolic_plane(self):
+        a, d = sympy.symbols('a d', real=True)
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        matrix = pm.perspective(FRUSTUM_BOUNDS, ndc_bounds)
+        result = pm.oblique_projection(matrix, ndc_bounds, [a, 0, 1, d])
+        instance = result.subs({a: sympy.Rational(1, 2), d: -5})
+        expected = pm.oblique_projection(matrix, ndc_bounds, [sympy.Rational(1, 2), 0, 1, -5])
+
+        assert result.has(sympy.Piecewise)
+        assert (instance - expected).applyfunc(sympy.simplify) == sympy.zeros(4, 4)
+
+    def test_array_matches_symbolic(self):
+        rng = np.random.default_rng(0)
+        for ndc_bounds in (pm.NDCBounds(-1, 1, -1, 1, -1, 1), pm.NDCBounds(-1, 1, 1, -1, 0, 1)):
+            frustum_bounds = pm.FrustumBounds(0.5, 1, 1, 0.75, 0.5, 50)
+            matrix = pm.perspective(frustum_bounds, ndc_bounds)
+            planes = rng.uniform(-1, 1, (16, 4))
+            planes[:, 2] = rng.uniform(0.5, 1, 16)
+            planes[:, 3] = rng.uniform(-10, -1, 16)
+            result = pm.oblique_projection_array(pm.perspective_array(frustum_bounds, ndc_bounds), ndc_bounds, planes)
+
+            assert result.shape == (16, 4, 4)
+            for plane, oblique in zip(planes, result):
+                expected = pm.oblique_projection(matrix, ndc_bounds, sympy.Matrix(plane))
+                assert np.allclose(oblique, np.array(expected.evalf().tolist(), dtype=np.float64))
+
+    def test_visible_far_corners_are_not_clipped(self):
+        far_corners = [[x, y, 100] for x in (-100, 100) for y in (-100, 100)]
+        planes = [[0, 0.6, 1, -5], [0, -0.6, 1, -5], [0.6, 0, 1, -5], [-0.6, 0.3, 1, -5]]
+        for ndc_bounds in (pm.NDCBounds(-1, 1, -1, 1, 0, 1), pm.NDCBounds(1, -1, 1, -1, -1, 1)):
+            matrix = pm.perspective(FRUSTUM_BOUNDS, ndc_bounds)
+            for plane in planes:
+                symbolic = pm.oblique_projection(matrix, ndc_bounds, sympy.Matrix(plane).applyfunc(sympy.nsimplify))
+                array = pm.oblique_projection_array(np.array(matrix.tolist(), dtype=np.float64), ndc_bounds, plane)
+
+                assert array.shape == (4, 4)
+                assert np.allclose(array, np.array(symbolic.tolist(), dtype=np.float64))
+                for corner in far_corners:
+                    if np.dot(plane, corner + [1]) >= 0:
+                        assert ndc_depth(array, corner) <= float(ndc_bounds.depth_max) + 1e-12
@@ -0,0 +1,59 @@
+import numpy as np
+import projection_matrices as pm
+import pytest
+import sympy
+
+
+class TestPacking:
+    def test_pack_symbolic_matrix_column_major(self):
+        frustum_fov_bounds = pm.FrustumFovBounds(sympy.Rational(16, 9), sympy.pi / 2, 1, 100)
+        matrix = pm.perspective_fov(frustum_fov_bounds, pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+        buffer = bytearray(64)
+        end = pm.pack_matrices(matrix, buffer)
+        expected = np.array(matrix.evalf().tolist(), dtype=np.float64).T.astype(np.float32).tobytes()
+
+        assert end == 64
+        assert bytes(buffer) == expected
+
+    def test_pack_batch_at_offset_into_numpy_buffer(self):
+        rng = np.random.default_rng(0)
+        matrices = rng.standard_normal((3, 4, 4))
+        buffer = np.zeros(256, dtype=np.uint8)
+        end = pm.pack_matrices(matrices, buffer, offset=64, block_layout='std430', order='row_major')
+        result = np.frombuffer(buffer, dtype='<f4', count=48, offset=64).reshape(3, 4, 4)
+
+        assert end == 256
+        assert not buffer[:64].any()
+        assert np.allclose(result, matrices.astype(np.float32))
+
+    def test_pack_float16_std140_padding(self):
+        matrices = np.arange(16, dtype=np.float64).reshape(1, 4, 4)
+        buffer = bytearray(pm.packed_size(1, 'std140', np.float16))
+        pm.pack_matrices(matrices, buffer, block_layout='std140', dtype=np.float16)
+        result = np.frombuffer(buffer, dtype='<f2').reshape(4, 8)
+
+        assert pm.matrix_layout('std140', np.float16) == (16, 16)
+        assert pm.matrix_layout('std430', np.float16) == (8, 8)
+        assert len(buffer) == 64
+        assert np.array_equal(result[:, :4], matrices[0].T)
+        assert not result[:, 4:].any()
+
+    def test_pack_interleaved_stride(self):
+        matrices = np.stack([np.eye(4), 2 * np.eye(4)])
+        buffer = memoryview(bytearray(pm.packed_size(2, 'std140', np.float32, matrix_stride=80)))
+        end = pm.pack_matrices(matrices, buffer, matrix_stride=80)
+        result = np.frombuffer(buffer, dtype='<f4')
+
+        assert end == 160
+        assert np.array_equal(result[:16].reshape(4, 4), np.eye(4))
+        assert not result[16:20].any()
+        assert np.array_equal(result[20:36].reshape(4, 4), 2 * np.eye(4))
+
+    def test_pack_invalid_arguments(self):
+        matrix = np.eye(4)
+        with pytest.raises(ValueError):
+            pm.pack_matrices(matrix, bytearray(32))
+        with pytest.raises(ValueError):
+            pm.pack_matrices(matrix, bytearray(128), offset=8)
+        with pytest.raises(ValueError):
+            pm.pack_matrices(matrix, bytes(64))
@@ -0,0 +1,83 @@
+import math
+
+import numpy as np
+import projection_matrices as pm
+
+
+def unproject_pixels(matrix: np.ndarray, width: int, height: int, pixels: np.ndarray) -> np.ndarray:
+    ndc = np.empty(pixels.shape[:-1] + (4,))
+    ndc[..., 0] = 2 * pixels[..., 0] / width - 1
+    ndc[..., 1] = 1 - 2 * pixels[..., 1] / height
+    ndc[..., 2] = 0
+    ndc[..., 3] = 1
+    points = ndc @ np.linalg.inv(matrix).T
+
+    return points[..., :3] / points[..., 3:]
+
+
+class TestRays:
+    def test_pixel_rays_match_unprojection(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        frustum_bounds = pm.FrustumBounds(0.5, 1.5, 0.75, 1, 1, 100)
+        matrix = pm.perspective_array(frustum_bounds, ndc_bounds)
+        pixels = np.random.default_rng(0).uniform(0, [640, 480], (100, 2))
+        origins, directions = pm.pixel_rays(frustum_bounds, 640, 480, pixels, dtype=np.float64)
+        points = unproject_pixels(matrix, 640, 480, pixels)
+
+        assert np.array_equal(origins, np.zeros((100, 3)))
+        assert np.allclose(directions, points / np.linalg.norm(points, axis=-1, keepdims=True))
+
+    def test_pixel_rays_use_out_dtype(self):
+        frustum_bounds = pm.FrustumBounds(1, 1, 1, 1, 1, 100)
+        pixels = np.array([[1000.5 + 1e-6, 0.5]])
+        out = (np.empty((1, 3)), np.empty((1, 3)))
+        origins, directions = pm.pixel_rays(
+            frustum_bounds, 2000, 1000, pixels, projection='orthographic', out=out
+        )
+
+        assert origins is out[0] and directions is out[1]
+        assert np.isclose(origins[0, 0], -1 + 2 * pixels[0, 0] / 2000, rtol=0, atol=1e-12)
+
+    def test_viewport_rays_fov(self):
+        frustum_fov_bounds = pm.FrustumFovBounds(2, math.pi / 2, 0.1, 100)
+        origins, directions = pm.viewport_rays(frustum_fov_bounds, 4, 2, normalize=False)
+
+        assert origins.shape == directions.shape == (2, 4, 3)
+        assert directions.dtype == np.float32
+        assert np.allclose(directions[0, 0], [-0.15, 0.05, 0.1])
+        assert np.allclose(directions[1, 3], [0.15, -0.05, 0.1])
+
+    def test_orthographic_rays(self):
+        frustum_bounds = pm.FrustumBounds(2, 2, 1, 1, 1, 10)
+        origins, directions = pm.viewport_rays(frustum_bounds, 2, 2, projection='orthographic')
+
+        assert np.allclose(origins[..., :2], [[[-1, 0.5], [1, 0.5]], [[-1, -0.5], [1, -0.5]]])
+        assert np.allclose(origins[..., 2], 0)
+        assert np.allclose(directions, [0, 0, 1])
+
+    def test_jitter_and_out(self):
+        frustum_fov_bounds = pm.FrustumFovBounds(16 / 9, 1, 0.1, 100)
+        out = (np.empty((90, 160, 3), dtype=np.float32), np.empty((90, 160, 3), dtype=np.float32))
+        origins, directions = pm.viewport_rays(frustum_fov_bounds, 160, 90, jitter=[0.25, -0.25], out=out)
+        rows, cols = np.mgrid[0:90, 0:160]
+        pixels = np.stack([cols + 0.75, rows + 0.25], axis=-1)
+        _, expected = pm.pixel_rays(frustum_fov_bounds, 160, 90, pixels)
+
+        assert origins is out[0] and directions is out[1]
+        assert np.allclose(directions, expected, atol=1e-6)
+
+        _, random = pm.viewport_rays(frustum_fov_bounds, 160, 90, jitter=np.random.default_rng(0))
+        _, centered = pm.viewport_rays(frustum_fov_bounds, 160, 90)
+        assert not np.allclose(random, centered, atol=1e-6)
+        assert np.allclose(np.linalg.norm(random, axis=-1), 1, atol=1e-6)
+
+    def test_tiles_cover_viewport(self):
+        frustum_fov_bounds = pm.FrustumFovBounds(4 / 3, 1, 0.1, 100)
+        origins, directions = pm.viewport_rays(frustum_fov_bounds, 100, 70)
+        covered = np.zeros((70, 100), dtype=int)
+        for rows, cols, tile_origins, tile_directions in pm.viewport_ray_tiles(frustum_fov_bounds, 100, 70, (32, 48)):
+            covered[rows, cols] += 1
+            assert np.array_equal(tile_origins, origins[rows, cols])
+            assert np.array_equal(tile_directions, directions[rows, cols])
+
+        assert np.all(covered == 1)
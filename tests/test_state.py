@@ -0,0 +1,52 @@
+import numpy as np
+import projection_matrices as pm
+
+
+def expected_matrices(state: pm.ProjectionState) -> np.ndarray:
+    frustum_fov_bounds = pm.FrustumFovBounds(*np.array([
+        [state[i].aspect_ratio, state[i].vfov, state[i].near, state[i].far] for i in range(len(state))
+    ]).T)
+
+    return pm.perspective_fov_array(frustum_fov_bounds, state.ndc_bounds)
+
+
+class TestProjectionState:
+    def test_initial_state(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        state = pm.ProjectionState(pm.FrustumFovBounds([1.0, 1.5, 2.0], 1.0, 0.1, 100), ndc_bounds)
+        matrices = expected_matrices(state)
+
+        assert len(state) == 3
+        assert np.allclose(state.matrices(), matrices)
+        assert np.allclose(state.inverses(), np.linalg.inv(matrices))
+        assert np.allclose(state.planes(), pm.clip_planes(ndc_bounds) @ matrices)
+
+    def test_update_recomputes_changed_viewports(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, -1, 1)
+        state = pm.ProjectionState(pm.FrustumFovBounds(1.5, 1.0, 0.1, 100), ndc_bounds, count=4)
+        state.inverses()
+        state.planes()
+        state.update(1, aspect_ratio=2.0)
+        state.update([2, 3], vfov=0.5, far=10)
+        matrices = expected_matrices(state)
+
+        assert state[1] == pm.FrustumFovBounds(2.0, 1.0, 0.1, 100)
+        assert np.allclose(state.matrices(), matrices)
+        assert np.allclose(state.inverses(), np.linalg.inv(matrices))
+        assert np.allclose(state.planes(), pm.clip_planes(ndc_bounds) @ matrices)
+
+    def test_packed_buffer_tracks_updates(self):
+        ndc_bounds = pm.NDCBounds(-1, 1, -1, 1, 0, 1)
+        state = pm.ProjectionState(pm.FrustumFovBounds([1.0, 1.5], 1.0, 1, 100), ndc_bounds)
+        packed = state.packed()
+        assert np.allclose(np.frombuffer(packed, dtype='<f4').reshape(2, 4, 4).transpose(0, 2, 1), state.matrices())
+
+        state.update(0, near=2)
+        packed = state.packed()
+        result = np.frombuffer(packed, dtype='<f4').reshape(2, 4, 4).transpose(0, 2, 1)
+
+        assert packed.readonly
+        assert np.allclose(result, expected_matrices(state))
+
+        packed = state.packed(block_layout='std430', order='row_major', dtype=np.float64)
+        assert np.allclose(np.frombuffer(packed, dtype='<f8').reshape(2, 4, 4), expected_matrices(state))
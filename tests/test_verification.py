@@ -0,0 +1,60 @@
+import pytest
+import sympy
+import projection_matrices as pm
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+class UnflippedConvention(pm.Convention):
+    def clip_transform(self) -> sympy.Matrix:
+        return sympy.Matrix.eye(4)
+
+
+class NegatedConvention(pm.Convention):
+    def apply(self, matrix: sympy.Matrix) -> sympy.Matrix:
+        return -super().apply(matrix)
+
+
+class TestVerification:
+    def test_all_conventions_pass(self):
+        results = pm.verify_conventions()
+
+        assert len(results) == 3 * len(pm.CONVENTIONS)
+        assert all(result.passed for result in results)
+        assert [(result.convention, result.kind) for result in results[:3]] == [
+            ('opengl_lh', 'perspective'), ('opengl_lh', 'perspective_fov'), ('opengl_lh', 'orthographic')
+        ]
+        assert pm.format_verification(results).endswith(f'{len(results)} passed, 0 failed, '
+                                                        f'{sum(r.elapsed for r in results):.3f}s total case time')
+
+    def test_table_row_adds_convention(self):
+        conventions = pm.conventions_from_table(pm.CONVENTION_TABLE + (('webgpu', 'left', 'up', (0, 1)),))
+        with ThreadPoolExecutor(2) as executor:
+            results = pm.verify_conventions({'webgpu_lh': conventions['webgpu_lh']}, executor=executor)
+
+        assert conventions['vulkan_rh'] == pm.CONVENTIONS['vulkan_rh']
+        assert [result.passed for result in results] == [True, True, True]
+
+    def test_incorrect_convention_fails(self):
+        convention = UnflippedConvention('vulkan', 'left', 'down', pm.NDCBounds(-1, 1, -1, 1, 0, 1))
+        with ThreadPoolExecutor(2) as executor:
+            results = pm.verify_conventions({'broken': convention}, kinds=('orthographic',), executor=executor)
+
+        assert not results[0].passed
+        assert len(results[0].failures) == 8
+        assert 'FAILED' in pm.format_verification(results)
+
+    def test_invalid_table_row(self):
+        with pytest.raises(ValueError):
+            pm.conventions_from_table([('opengl', 'up', 'up', (-1, 1))])
+        with pytest.raises(ValueError):
+            pm.conventions_from_table([('opengl', 'left', 'up', (-1, 1))] * 2)
+
+    def test_negated_matrix_fails(self):
+        convention = NegatedConvention('opengl', 'right', 'up', pm.NDCBounds(-1, 1, -1, 1, -1, 1))
+        with ThreadPoolExecutor(2) as executor:
+            results = pm.verify_conventions({'negated': convention}, executor=executor)
+
+        assert not any(result.passed for result in results)
+        assert all(len(result.failures) == 8 for result in results)
+        assert all('expected w > 0' in failure for result in results for failure in result.failures)